@@ -83,4 +83,28 @@ def bezier(p0: QPointF, p1: QPointF, p2: QPointF, p3: QPointF):
         s2x += s3x
         s2y += s3y
 
-    return pixels
\ No newline at end of file
+    return pixels
+
+# Rounds n + 1 points of the arc around (cx, cy) starting at angle a_start
+# and advancing by step to integer pixels. Returns the pixels and their
+# bounds (minx, miny, maxx, maxy)
+def arc(cx: float, cy: float, R: float, a_start: float, step: float, n: int):
+    # Instead of evaluating cos/sin per sample, the radius vector is rotated
+    # by step with a fixed rotation matrix
+    c, s = math.cos(step), math.sin(step)
+    x = R * math.cos(a_start)
+    y = R * math.sin(a_start)
+    points = []
+    append = points.append
+    minx = miny = 1e18
+    maxx = maxy = -1e18
+    for _ in range(n + 1):
+        px = int(round(cx + x))
+        py = int(round(cy + y))
+        append((px, py))
+        if px < minx: minx = px
+        if py < miny: miny = py
+        if px > maxx: maxx = px
+        if py > maxy: maxy = py
+        x, y = c * x - s * y, s * x + c * y
+    return points, minx, miny, maxx, maxy
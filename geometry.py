@@ -1,5 +1,5 @@
 import math
-from model import EdgeType
+from model import ContinuityType, EdgeType
 
 def unit(x: float, y: float):
     l = math.hypot(x, y)
@@ -7,19 +7,52 @@ def unit(x: float, y: float):
         return (None, 0.0)
     return ((x / l, y / l), l)
 
-def rot90_ccw(vx: float, vy: float):
-    return (-vy, vx)
+# Unit vectors along the four 45° diagonals, indexed by the quadrant bits
+# computed in diagonal_45_direction
+_INV_SQRT2 = 1.0 / math.sqrt(2.0)
+DIAGONAL_45_DIRECTIONS = (
+    (_INV_SQRT2, _INV_SQRT2),
+    (-_INV_SQRT2, _INV_SQRT2),
+    (_INV_SQRT2, -_INV_SQRT2),
+    (-_INV_SQRT2, -_INV_SQRT2),
+)
 
-def rot90_cw(vx, vy):
-    return (vy, -vx)
+def diagonal_45_direction(dx: float, dy: float):
+    # Bit 0 is set for dx < 0, bit 1 for dy < 0 (zero counts as positive)
+    return DIAGONAL_45_DIRECTIONS[(dx < 0) | ((dy < 0) << 1)]
+
+TAU = 2.0 * math.pi
 
 def norm_angle(a: float) -> float:
-    # Normalize into [0, 2π)
-    while a < 0:
-        a += 2 * math.pi
-    while a >= 2 * math.pi:
-        a -= 2 * math.pi
-    return a
+    # Normalize into [0, 2π); Python's % already maps negative angles into
+    # range, but rounds tiny negative values up to exactly 2π
+    a %= TAU
+    return 0.0 if a >= TAU else a
+
+def arc_cubic_segments(cx: float, cy: float, R: float, a_start: float, sign: float, total_angle: float):
+    """Approximate a circular arc with up to four cubic Bezier segments.
+
+    Each segment spans at most 90°; its control points lie on the end
+    tangents at a distance of 4/3 * tan(θ/4) * R. Returns a list of
+    (c1x, c1y, c2x, c2y, x, y) tuples, the arc starting at angle a_start
+    and sweeping total_angle in the direction of sign.
+    """
+    segments = max(1, min(4, math.ceil(total_angle / (math.pi * 0.5) - 1e-9)))
+    step = sign * total_angle / segments
+    k = 4.0 / 3.0 * math.tan(total_angle / segments * 0.25) * R * sign
+    cos, sin = math.cos, math.sin
+    c0, s0 = cos(a_start), sin(a_start)
+    out = []
+    for i in range(segments):
+        a = a_start + step * (i + 1)
+        c3, s3 = cos(a), sin(a)
+        out.append((
+            cx + R * c0 - k * s0, cy + R * s0 + k * c0,
+            cx + R * c3 + k * s3, cy + R * s3 - k * c3,
+            cx + R * c3, cy + R * s3,
+        ))
+        c0, s0 = c3, s3
+    return out
 
 def neighbour_tangent(edges, idx: int, current_edge, vertex, at_v1: bool):
     """Compute unit tangent direction at `vertex` using the neighbouring edge.
@@ -38,7 +71,7 @@ def neighbour_tangent(edges, idx: int, current_edge, vertex, at_v1: bool):
     if at_v1:
         ne = edges[(idx - 1) % n_edges]
         # Special case: vertex adjacent to two arcs with G1 -> use bisector tangent
-        if getattr(ne, 'type', None) == EdgeType.ARC and getattr(vertex, 'continuity', None) and getattr(vertex.continuity, 'name', None) == 'G1':
+        if ne.type is EdgeType.ARC and vertex.continuity is ContinuityType.G1:
             if ne.v2 is vertex:
                 inx, iny = vertex.x - ne.v1.x, vertex.y - ne.v1.y
             else:
@@ -55,14 +88,14 @@ def neighbour_tangent(edges, idx: int, current_edge, vertex, at_v1: bool):
             vx_, vy_ = vertex.x - ne.v1.x, vertex.y - ne.v1.y
         else:
             vx_, vy_ = ne.v2.x - vertex.x, ne.v2.y - vertex.y
-        if getattr(ne, 'type', None) == EdgeType.BEZIER:
+        if ne.type is EdgeType.BEZIER:
             try:
                 vx_, vy_ = vertex.x - ne.c2.x, vertex.y - ne.c2.y
             except Exception:
                 pass
     else:
         ne = edges[(idx + 1) % n_edges]
-        if getattr(ne, 'type', None) == EdgeType.ARC and getattr(vertex, 'continuity', None) and getattr(vertex.continuity, 'name', None) == 'G1':
+        if ne.type is EdgeType.ARC and vertex.continuity is ContinuityType.G1:
             inx, iny = vertex.x - e.v1.x, vertex.y - e.v1.y
             if ne.v1 is vertex:
                 outx, outy = ne.v2.x - vertex.x, ne.v2.y - vertex.y
@@ -78,7 +111,7 @@ def neighbour_tangent(edges, idx: int, current_edge, vertex, at_v1: bool):
             vx_, vy_ = ne.v2.x - vertex.x, ne.v2.y - vertex.y
         else:
             vx_, vy_ = vertex.x - ne.v1.x, vertex.y - ne.v1.y
-        if getattr(ne, 'type', None) == EdgeType.BEZIER:
+        if ne.type is EdgeType.BEZIER:
             try:
                 vx_, vy_ = ne.c1.x - vertex.x, ne.c1.y - vertex.y
             except Exception:
@@ -87,12 +120,6 @@ def neighbour_tangent(edges, idx: int, current_edge, vertex, at_v1: bool):
     u_, _ = unit(vx_, vy_)
     return u_
 
-def normalize_vector(vec: tuple[float, float]):
-    length = math.hypot(vec[0], vec[1])
-    if length < 1e-8:
-        return (None, length)
-    return ((vec[0] / length, vec[1] / length), length)
-
 def compute_arc_geometry_for_edge(edges, idx: int, arc_edge):
     """Compute arc circle geometry (scene coords) for the given arc edge.
 
@@ -119,15 +146,15 @@ def compute_arc_geometry_for_edge(edges, idx: int, arc_edge):
         return (Cx, Cy, R, 0.0, 0.0, True)
 
     # continuity flags (only one end may be G1)
-    g1_v1 = getattr(v1, 'continuity', None) and getattr(v1.continuity, 'name', None) == 'G1'
-    g1_v2 = getattr(v2, 'continuity', None) and getattr(v2.continuity, 'name', None) == 'G1'
+    g1_v1 = v1.continuity is ContinuityType.G1
+    g1_v2 = v2.continuity is ContinuityType.G1
     if g1_v1 and g1_v2:
         g1_v2 = False
 
     # Base center at chord midpoint and radius as semicircle
     Mx = (x1 + x2) * 0.5
     My = (y1 + y2) * 0.5
-    ncx, ncy = rot90_ccw(*chord_u)  # perpendicular to chord
+    ncx, ncy = -chord_u[1], chord_u[0]  # perpendicular to chord
     Cx, Cy = Mx, My
     R = chord_len * 0.5
     prefer_ccw = True
@@ -141,7 +168,7 @@ def compute_arc_geometry_for_edge(edges, idx: int, arc_edge):
             t = neighbour_tangent(edges, idx, arc_edge, v2, False)
             Px, Py = x2, y2
         if t is not None:
-            ntx, nty = rot90_ccw(*t)  # normal to tangent at P
+            ntx, nty = -t[1], t[0]  # normal to tangent at P
             mx, my = Mx - Px, My - Py
             det = ntx * (-ncy) - nty * (-ncx)
             if abs(det) > 1e-8:
@@ -152,11 +179,9 @@ def compute_arc_geometry_for_edge(edges, idx: int, arc_edge):
                 rx, ry = Px - Cx, Py - Cy
                 r_u, _ = unit(rx, ry)
                 if r_u is not None:
-                    t_ccw = rot90_ccw(*r_u)
-                    t_cw = rot90_cw(*r_u)
-                    dot_ccw = t_ccw[0] * t[0] + t_ccw[1] * t[1]
-                    dot_cw = t_cw[0] * t[0] + t_cw[1] * t[1]
-                    prefer_ccw = dot_ccw >= dot_cw
+                    # The CW tangent is the negated CCW one (-r_u.y, r_u.x), so
+                    # comparing their dot products with t is a sign test
+                    prefer_ccw = r_u[0] * t[1] - r_u[1] * t[0] >= 0
 
     # Angles for v1 -> v2
     a1 = math.atan2(y1 - Cy, x1 - Cx)
@@ -165,10 +190,10 @@ def compute_arc_geometry_for_edge(edges, idx: int, arc_edge):
     if prefer_ccw:
         sweep = a2n - a1n
         if sweep <= 0:
-            sweep += 2 * math.pi
+            sweep += TAU
     else:
         sweep = a1n - a2n
         if sweep <= 0:
-            sweep += 2 * math.pi
+            sweep += TAU
         sweep = -sweep
     return (Cx, Cy, R, a1, a1 + sweep, prefer_ccw)
\ No newline at end of file
@@ -1,18 +1,15 @@
 from model import Arc, EdgeType
-from graphics.edge_item import EdgeItem
+from graphics.edge_item import EdgeItem, rasterize_pixels
 from PySide6.QtWidgets import QMenu
 from PySide6.QtGui import (
-    QBrush,
-    QColor,
     QPainterPath,
-    QImage,
     QPixmap,
-    QPainter
 )
-from PySide6.QtCore import QPointF, QRectF, Qt
+from PySide6.QtCore import QPointF, QRectF
 
 import math
-from geometry import compute_arc_geometry_for_edge
+import algorithms
+from geometry import arc_cubic_segments, compute_arc_geometry_for_edge
 
 class ArcEdgeItem(EdgeItem):
     def __init__(self, edge: Arc, parent):
@@ -27,6 +24,12 @@ class ArcEdgeItem(EdgeItem):
         # path cache used for hit-testing/selection
         self._path_cache = None
 
+        # Circle of the arc in scene coords as (Cx, Cy, R, a_start, sign,
+        # total_angle), or None when the edge is not part of the polygon.
+        # geometry_version is the parent's shape_version it was computed at
+        self.geometry = None
+        self.geometry_version = None
+
         self.update_edge()
 
     def contextMenuEvent(self, event):
@@ -46,32 +49,31 @@ class ArcEdgeItem(EdgeItem):
         event.accept()
 
     def convert_coords_to_parent(self):
-        p0 = self.mapFromScene(QPointF(self.edge.v1.x, self.edge.v1.y))
-        p3 = self.mapFromScene(QPointF(self.edge.v2.x, self.edge.v2.y))
+        e = self.edge
+        p0 = self._scene_to_parent(e.v1.x, e.v1.y)
+        p3 = self._scene_to_parent(e.v2.x, e.v2.y)
         return (p0, p3)
         
-    def update_edge(self):
+    def recompute_geometry(self):
         # scene geometry via shared helper
         parent = self.parentItem()
-        edges = getattr(getattr(parent, 'polygon', None), 'edges', None)
+        self.geometry = None
+        self.geometry_version = parent.shape_version
+        edges = parent.polygon.edges
         if not edges:
-            # fallback: nothing to draw; keep tiny bbox around chord
-            p0, p3 = self.convert_coords_to_parent()
-            path = QPainterPath()
-            path.moveTo(p0)
-            path.lineTo(p3)
-            control_rect = path.boundingRect().adjusted(-2, -2, 2, 2)
-            self.prepareGeometryChange()
-            self._pixels = []
-            self._pixmap = None
-            self._pixmap_offset = QPointF(0, 0)
-            self._cached_bounding = control_rect
-            self._path_cache = path
-            return
-        try:
-            idx = edges.index(self.edge)
-        except ValueError:
-            # If edge not found, use chord-only fallback
+            return None
+        idx = parent.edge_index(self.edge)
+        if idx is None:
+            return None
+        Cx, Cy, R, a_start, a_end, _ = compute_arc_geometry_for_edge(edges, idx, self.edge)
+        sweep = a_end - a_start
+        self.geometry = (Cx, Cy, R, a_start, math.copysign(1.0, sweep), abs(sweep))
+        return self.geometry
+
+    def update_edge(self):
+        geometry = self.recompute_geometry()
+        if geometry is None:
+            # fallback (no polygon or edge not in it): keep tiny bbox around chord
             p0, p3 = self.convert_coords_to_parent()
             path = QPainterPath()
             path.moveTo(p0)
@@ -85,11 +87,10 @@ class ArcEdgeItem(EdgeItem):
             self._path_cache = path
             return
 
-        Cx, Cy, R, a_start, a_end, prefer_ccw = compute_arc_geometry_for_edge(edges, idx, self.edge)
+        Cx, Cy, R, a_start, sign, total_angle = geometry
 
     # convert to parent-local for rasterization
         # sample points
-        total_angle = abs(a_end - a_start)
         if total_angle < 1e-6 or R < 1e-6:
             # nothing to draw; keep tiny bbox around chord
             p0, p3 = self.convert_coords_to_parent()
@@ -109,24 +110,12 @@ class ArcEdgeItem(EdgeItem):
         n = max(int(R * total_angle * 1.5), 32)
         n = min(n, 2000)
         dt = total_angle / n
-        sign = 1.0 if (a_end - a_start) >= 0 else -1.0
 
         # generate points in parent-local coords
-        points = []
-        minx = miny = 1e18
-        maxx = maxy = -1e18
-        for i in range(n + 1):
-            a = a_start + sign * dt * i
-            sx = Cx + R * math.cos(a)
-            sy = Cy + R * math.sin(a)
-            p = self.mapFromScene(QPointF(sx, sy))
-            px = int(round(p.x()))
-            py = int(round(p.y()))
-            points.append((px, py))
-            if px < minx: minx = px
-            if py < miny: miny = py
-            if px > maxx: maxx = px
-            if py > maxy: maxy = py
+        center = self._scene_to_parent(Cx, Cy)
+        cx = center.x()
+        cy = center.y()
+        points, minx, miny, maxx, maxy = algorithms.arc(cx, cy, R, a_start, sign * dt, n)
 
         width = max(0, maxx - minx + 1)
         height = max(0, maxy - miny + 1)
@@ -149,29 +138,16 @@ class ArcEdgeItem(EdgeItem):
         new_bounding = control_rect.united(QRectF(minx, miny, width, height))
         self.prepareGeometryChange()
 
-        img = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
-        img.fill(0)
-        qp = QPainter(img)
-        try:
-            qp.setPen(Qt.NoPen)
-            qp.setBrush(QBrush(QColor("black")))
-            for (px, py) in points:
-                rx = px - minx
-                ry = py - miny
-                if 0 <= rx < width and 0 <= ry < height:
-                    qp.drawRect(rx, ry, 1, 1)
-        finally:
-            qp.end()
-
+        img = rasterize_pixels(points, minx, miny, width, height)
         self._pixmap = QPixmap.fromImage(img)
         self._pixmap_offset = QPointF(minx, miny)
         self._cached_bounding = new_bounding
-        # path used for selection/hit-testing: approximate polyline
+        # path used for selection/hit-testing: the arc as a few cubics rather
+        # than a polyline through every sample
         path = QPainterPath()
-        if points:
-            path.moveTo(points[0][0], points[0][1])
-            for (px, py) in points[1:]:
-                path.lineTo(px, py)
+        path.moveTo(cx + R * math.cos(a_start), cy + R * math.sin(a_start))
+        for segment in arc_cubic_segments(cx, cy, R, a_start, sign, total_angle):
+            path.cubicTo(*segment)
         self._path_cache = path
 
     def boundingRect(self):
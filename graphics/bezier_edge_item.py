@@ -1,15 +1,12 @@
 from model import Bezier, EdgeType, Vertex
 from graphics.control_point_item import ControlPointItem
-from graphics.edge_item import EdgeItem
+from graphics.edge_item import EdgeItem, rasterize_pixels
 from PySide6.QtWidgets import QMenu
 from PySide6.QtGui import (
-    QBrush,
     QColor,
     QPainterPath,
     QPen,
-    QImage,
     QPixmap,
-    QPainter
 )
 from PySide6.QtCore import QPointF, QRectF, Qt
 
@@ -55,10 +52,12 @@ class BezierEdgeItem(EdgeItem):
         event.accept()
 
     def _convert_coords_to_parent(self):
-        p0 = self.mapFromScene(QPointF(self.edge.v1.x, self.edge.v1.y))
-        p1 = self.mapFromScene(QPointF(self.edge.c1.x, self.edge.c1.y))
-        p2 = self.mapFromScene(QPointF(self.edge.c2.x, self.edge.c2.y))
-        p3 = self.mapFromScene(QPointF(self.edge.v2.x, self.edge.v2.y))
+        e = self.edge
+        to_parent = self._scene_to_parent
+        p0 = to_parent(e.v1.x, e.v1.y)
+        p1 = to_parent(e.c1.x, e.c1.y)
+        p2 = to_parent(e.c2.x, e.c2.y)
+        p3 = to_parent(e.v2.x, e.v2.y)
         return (p0, p1, p2, p3)
     
     def _place_control_handles(self):
@@ -72,6 +71,12 @@ class BezierEdgeItem(EdgeItem):
             self.updating_from_parent = False
 
     def on_control_moved(self, control_point: Vertex, new_scene_pos: QPointF):
+        parent = self.parentItem()
+        # The polygon's shape follows the handles, so its cached geometry is
+        # dropped while it still describes the old position
+        if parent:
+            parent._invalidate_geometry()
+
         # Update control point position
         control_point.x = new_scene_pos.x()
         control_point.y = new_scene_pos.y()
@@ -80,16 +85,14 @@ class BezierEdgeItem(EdgeItem):
         self.update_edge()
         self.update()
 
-        parent = self.parentItem()
         if parent:
             # Inform parent which control point moved so the moved handle 
-            # remains the driver
+            # remains the driver; the parent redraws whichever other edges
+            # that affects
             if control_point is self.edge.c1:
                 parent.enforce_vertex_continuity_from_control(self.edge.v1, moved_control='next')
             elif control_point is self.edge.c2:
                 parent.enforce_vertex_continuity_from_control(self.edge.v2, moved_control='prev')
-            for e_item in parent.edge_items:
-                    e_item.update_edge()
             parent.update()
     
     def update_edge(self):
@@ -117,13 +120,22 @@ class BezierEdgeItem(EdgeItem):
             self._place_control_handles()
             return
 
-        # compute integer bounding box for pixels
-        x_vals = [p[0] for p in self._pixels]
-        y_vals = [p[1] for p in self._pixels]
-        minx = min(x_vals) - 1
-        miny = min(y_vals) - 1
-        maxx = max(x_vals) + 1
-        maxy = max(y_vals) + 1
+        # compute integer bounding box for pixels in a single pass
+        pixels = iter(self._pixels)
+        minx, miny = maxx, maxy = next(pixels)
+        for x, y in pixels:
+            if x < minx:
+                minx = x
+            elif x > maxx:
+                maxx = x
+            if y < miny:
+                miny = y
+            elif y > maxy:
+                maxy = y
+        minx -= 1
+        miny -= 1
+        maxx += 1
+        maxy += 1
 
         width = maxx - minx + 1
         height = maxy - miny + 1
@@ -148,21 +160,7 @@ class BezierEdgeItem(EdgeItem):
         # Prepare for geometry change before updating cached geometry
         self.prepareGeometryChange()
 
-        img = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
-        img.fill(0)
-
-        qp = QPainter(img)
-        try:
-            qp.setPen(Qt.NoPen)
-            qp.setBrush(QBrush(QColor("black")))
-            for px, py in self._pixels:
-                rx = px - minx
-                ry = py - miny
-                if 0 <= rx < width and 0 <= ry < height:
-                    qp.drawRect(rx, ry, 1, 1)
-        finally:
-            qp.end()
-
+        img = rasterize_pixels(self._pixels, minx, miny, width, height)
         self._pixmap = QPixmap.fromImage(img)
         self._pixmap_offset = QPointF(minx, miny)
         self._cached_bounding = new_bounding
@@ -16,7 +16,9 @@ class ControlPointItem(QGraphicsEllipseItem):
         self.vertex = vertex
         self.setBrush(QBrush(color))
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable, True)
-        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemSendsScenePositionChanges, True)
+        # Only the item's own position changes are needed; scene position
+        # changes would also be reported whenever the polygon is dragged
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges, True)
         # Setting Z value to be above vertices and edges
         self.setZValue(3.0)
 
@@ -1,7 +1,24 @@
 from model import Edge
 from PySide6.QtWidgets import QGraphicsItem
-from PySide6.QtGui import QPainterPath
-from PySide6.QtCore import QRectF
+from PySide6.QtGui import QPainterPath, QImage
+from PySide6.QtCore import QPointF, QRectF
+
+# Opaque black as premultiplied ARGB32
+PIXEL_COLOR = 0xFF000000
+
+# Transparent width x height image with the given pixels, shifted by
+# (-dx, -dy), set to PIXEL_COLOR; pixels falling outside are skipped. Pixels
+# are whole, so they are written directly instead of painting 1x1 rects
+def rasterize_pixels(pixels, dx: int, dy: int, width: int, height: int) -> QImage:
+    img = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+    img.fill(0)
+    set_pixel = img.setPixel
+    for px, py in pixels:
+        rx = px - dx
+        ry = py - dy
+        if 0 <= rx < width and 0 <= ry < height:
+            set_pixel(rx, ry, PIXEL_COLOR)
+    return img
 
 # Base class for edge items (StandardLineEdgeItem, BresenhamLineEdgeItem, 
 # BezierEdgeItem, ArcEdgeItem)
@@ -12,6 +29,13 @@ class EdgeItem(QGraphicsItem):
         # Setting Z value to be below vertices
         self.setZValue(1.0)
 
+    # Maps a scene point into the coordinates edge items draw in. The parent
+    # PolygonItem is never rotated nor scaled (it asserts an identity
+    # transform), so this is subtracting the scene origin
+    def _scene_to_parent(self, x: float, y: float) -> QPointF:
+        origin = self.scenePos()
+        return QPointF(x - origin.x(), y - origin.y())
+
     # Subclasses must implement:
     def update_edge(self) -> None:
         raise NotImplementedError
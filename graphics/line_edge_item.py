@@ -1,5 +1,5 @@
 from model import Edge, EdgeType, ConstraintType
-from graphics.edge_item import EdgeItem
+from graphics.edge_item import EdgeItem, rasterize_pixels
 from PySide6.QtWidgets import (
     QMenu,
     QInputDialog,
@@ -11,9 +11,7 @@ from PySide6.QtGui import (
     QPainterPath,
     QPainterPathStroker,
     QPen,
-    QImage,
     QPixmap,
-    QPainter
 )
 from PySide6.QtCore import QPointF, QRectF, Qt
 
@@ -31,8 +29,9 @@ class LineEdgeItem(EdgeItem):
         self.setAcceptedMouseButtons(Qt.LeftButton | Qt.RightButton)
 
     def _convert_coords_to_parent(self):
-        p1 = self.parentItem().mapFromScene(QPointF(self.edge.v1.x, self.edge.v1.y))
-        p2 = self.parentItem().mapFromScene(QPointF(self.edge.v2.x, self.edge.v2.y))
+        e = self.edge
+        p1 = self._scene_to_parent(e.v1.x, e.v1.y)
+        p2 = self._scene_to_parent(e.v2.x, e.v2.y)
         return (p1, p2)
     
     def contextMenuEvent(self, event):
@@ -81,7 +80,7 @@ class LineEdgeItem(EdgeItem):
         event.accept()
 
     def _draw_constraint_icon(self, painter):
-        ct = getattr(self.edge, "constraint_type", ConstraintType.NONE)
+        ct = self.edge.constraint_type
         if ct == ConstraintType.NONE:
             return
         mid = QPointF((self._p1.x() + self._p2.x()) / 2.0, (self._p1.y() + self._p2.y()) / 2.0)
@@ -197,20 +196,8 @@ class BresenhamLineEdgeItem(LineEdgeItem):
 
         self._pixels = algorithms.bresenham(rel_x0, rel_y0, rel_x1, rel_y1)
 
-        img = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
-        img.fill(0)  # We make sure its transparent
-
-        # Creating painter object on our image
-        qp = QPainter(img)
-        try:
-            qp.setPen(Qt.NoPen)
-            qp.setBrush(QBrush(QColor("black")))
-            # Drawing pixels into image with boundaries checking
-            for px, py in self._pixels:
-                if 0 <= px < width and 0 <= py < height:
-                    qp.drawRect(px, py, 1, 1)
-        finally:
-            qp.end()
+        # Drawing pixels into a transparent image with boundaries checking
+        img = rasterize_pixels(self._pixels, 0, 0, width, height)
 
         # Converting image to pixmap and updating bounding rectangle
         self._pixmap = QPixmap.fromImage(img)
@@ -9,10 +9,160 @@ from PySide6.QtGui import (
     QPainterPath,
     QPen,
 )
-from PySide6.QtCore import QPointF, QRectF, Qt
+from PySide6.QtCore import QEvent, QPointF, QRectF, Qt
 from geometry import *
 
 import math
+from math import hypot, sqrt
+
+# Enum members compared on the per-move paths, bound once at module level
+# because attribute lookups on Enum classes are comparatively slow
+_NO_CONSTRAINT = ConstraintType.NONE
+_VERTICAL = ConstraintType.VERTICAL
+_DIAGONAL_45 = ConstraintType.DIAGONAL_45
+_FIXED_LENGTH = ConstraintType.FIXED_LENGTH
+_G0 = ContinuityType.G0
+_G1 = ContinuityType.G1
+_C1 = ContinuityType.C1
+_LINE = EdgeType.LINE
+_BEZIER = EdgeType.BEZIER
+_ARC = EdgeType.ARC
+
+# Constraint enforcers used by PolygonItem._enforce_edge_constraint. Each one
+# moves v2 so that the edge v1 -> v2 satisfies the edge's constraint and
+# returns True
+
+def _apply_vertical(v1: Vertex, v2: Vertex, edge: Edge) -> bool:
+    v2.x = v1.x
+    return True
+
+def _apply_fixed_length(v1: Vertex, v2: Vertex, edge: Edge) -> bool:
+    L = edge.constraint_value
+    dx = v2.x - v1.x
+    dy = v2.y - v1.y
+    d2 = dx*dx + dy*dy
+    # Coincident endpoints (or practically so) have no direction to keep
+    if d2 < 1e-24:
+        v2.x = v1.x + L
+        v2.y = v1.y
+    else:
+        scale = L / sqrt(d2)
+        v2.x = v1.x + dx * scale
+        v2.y = v1.y + dy * scale
+    return True
+
+def _apply_diagonal_45(v1: Vertex, v2: Vertex, edge: Edge) -> bool:
+    # Project direction to nearest 45° while preserving current Euclidean length
+    dx = v2.x - v1.x
+    dy = v2.y - v1.y
+    dist = hypot(dx, dy)
+    if dist < 1e-8:
+        # If degenerate, keep a small step in the quadrant inferred by neighbors
+        dist = 1.0
+    ux, uy = diagonal_45_direction(dx, dy)
+    v2.x = v1.x + ux * dist
+    v2.y = v1.y + uy * dist
+    return True
+
+_CONSTRAINT_FNS = {
+    ConstraintType.VERTICAL: _apply_vertical,
+    ConstraintType.FIXED_LENGTH: _apply_fixed_length,
+    ConstraintType.DIAGONAL_45: _apply_diagonal_45,
+}
+
+# Places a Bezier handle at the given distance from (vx, vy) along the unit
+# direction (ux, uy); a negative length puts it on the opposite side
+def _place_handle(handle: Vertex, vx: float, vy: float, ux: float, uy: float, length: float):
+    handle.x = vx + ux * length
+    handle.y = vy + uy * length
+
+# Aligns the two handles of a G1 junction between Bezier edges at (vx, vy),
+# preserving their lengths. The handle named by driver ('prev' or 'next')
+# keeps its direction; otherwise prev_c2 leads, or next_c1 if prev_c2 sits on
+# the vertex. Returns whether a handle was placed
+def _align_bezier_handles_g1(vx: float, vy: float, prev_c2: Vertex, next_c1: Vertex, driver: str | None = None) -> bool:
+    pvx = vx - prev_c2.x
+    pvy = vy - prev_c2.y
+    prev_len = hypot(pvx, pvy)
+    nvx = next_c1.x - vx
+    nvy = next_c1.y - vy
+    next_len = hypot(nvx, nvy)
+
+    if driver == 'prev' and prev_len > 1e-8:
+        inv = 1.0 / prev_len
+        _place_handle(next_c1, vx, vy, pvx * inv, pvy * inv, max(next_len, 1e-8))
+    elif driver == 'next' and next_len > 1e-8:
+        inv = 1.0 / next_len
+        _place_handle(prev_c2, vx, vy, nvx * inv, nvy * inv, -max(prev_len, 1e-8))
+    elif prev_len > 1e-8:
+        inv = 1.0 / prev_len
+        ux = pvx * inv
+        uy = pvy * inv
+        # set next.c1 to point in same direction with its original length and
+        # snap prev.c2 to the exact opposite direction
+        _place_handle(next_c1, vx, vy, ux, uy, next_len)
+        _place_handle(prev_c2, vx, vy, ux, uy, -prev_len)
+    elif next_len > 1e-8:
+        inv = 1.0 / next_len
+        _place_handle(prev_c2, vx, vy, nvx * inv, nvy * inv, -prev_len)
+    else:
+        return False
+    return True
+
+# Unit direction (ux, uy) and length for the edge vertex -> other_vertex that
+# follow desired_dir as closely as the edge's constraint allows. Used when a
+# Bezier handle drives a neighbouring constrained line
+def _project_direction_to_constraint(
+    vertex: Vertex,
+    other_vertex: Vertex,
+    desired_dir: tuple[float, float] | None,
+    constraint_type: ConstraintType,
+    constraint_value,
+) -> tuple[float, float, float]:
+    vx = vertex.x
+    vy = vertex.y
+    dx = other_vertex.x - vx
+    dy = other_vertex.y - vy
+    edge_len = hypot(dx, dy)
+    current_len = edge_len
+    if current_len < 1e-8:
+        if constraint_type == _FIXED_LENGTH and constraint_value:
+            current_len = abs(constraint_value)
+        else:
+            current_len = 1.0
+
+    # Unit direction: the desired one, else along the edge, else +x
+    if desired_dir is None:
+        ddx, ddy = dx, dy
+    else:
+        ddx, ddy = desired_dir
+    L = hypot(ddx, ddy)
+    if L < 1e-8:
+        ddx, ddy, L = dx, dy, edge_len
+    if L < 1e-8:
+        ux, uy = 1.0, 0.0
+    else:
+        inv = 1.0 / L
+        ux = ddx * inv
+        uy = ddy * inv
+
+    # Signs follow the desired direction; a zero component falls back to
+    # the sign of the edge's own component
+    if constraint_type == _VERTICAL:
+        ux = 0.0
+        uy = math.copysign(1.0, uy or dy or 1.0)
+        base_len = current_len
+    elif constraint_type == _DIAGONAL_45:
+        ux, uy = diagonal_45_direction(ux or dx, uy or dy)
+        base_len = current_len
+    elif constraint_type == _FIXED_LENGTH:
+        base_len = abs(constraint_value) if constraint_value is not None else current_len
+        if base_len < 1e-8:
+            base_len = current_len if current_len > 1e-8 else 1.0
+    else:
+        base_len = current_len
+
+    return ux, uy, base_len
 
 class PolygonItem(QGraphicsItem):
     def __init__(self, polygon: Polygon):
@@ -32,39 +182,99 @@ class PolygonItem(QGraphicsItem):
         # updated by the parent (i.e. this class)
         self.updating_from_parent = False
 
-        # Properties used for implementing polygon dragging
+        # Properties used for implementing polygon dragging. While dragging
+        # only the item moves; the model lags behind it until the drag is
+        # committed by _commit_drag() on release or when the grab is lost
         self._dragging = False
         self._drag_start_scene = None
+        self._drag_start_pos = None
         self._original_vertices_positions = None
         self._original_control_positions = None
 
         self.vertex_items = {}
+        # Vertex items in polygon.vertices order, for iterating without
+        # going through the dict
+        self._vertex_item_list = []
         self.edge_items = []
+        # Signature of the structure child items were last built for
+        self._last_rebuild_sig = None
+
+        # Lookup maps rebuilt by _sync_edges_dict: vertex -> index in
+        # polygon.vertices, edge -> index in polygon.edges and vertex -> the
+        # (prev_edge, prev_idx, next_edge, next_idx) tuple returned by
+        # adjacent_edges_of_vertex
+        self._vertex_index = {}
+        self._edge_index = {}
+        self._adjacent_edges = {}
+
+        # Constraint propagation chains cached per dragged vertex
+        self._propagation_chains = {}
+
+        # Indices of edge items waiting for update_edge() after a vertex move
+        self._dirty_edges = set()
+
+        # Vertices whose continuity is stronger than G0, kept in sync by
+        # _set_vertex_continuity() so moves only revisit those
+        self._non_g0_vertices = set()
+
+        # Cached results of shape() and boundingRect(), dropped by
+        # _invalidate_geometry() whenever the geometry changes. The version
+        # counts invalidations; each ArcEdgeItem records the version its
+        # cached circle was computed at, and _build_shape() only reuses that
+        # circle while the versions match
+        self._cached_shape = None
+        self._cached_bounding = None
+        self.shape_version = 0
+
+        # Pen of the selection outline drawn in paint()
+        self._selection_pen = QPen(QColor("blue"), 1, Qt.DashLine)
+
+        # Scene -> local mapping is done by subtracting _scene_origin()
+        assert self.transform().isIdentity()
 
         self._setup_childitems()
         self._enforce_all_constraints_and_continuity()
 
+    # PolygonItem is a top-level item that is never rotated nor scaled, so
+    # mapping from scene coordinates is just subtracting its scene position
+    def _scene_origin(self) -> tuple[float, float]:
+        sp = self.scenePos()
+        return (sp.x(), sp.y())
+
     def boundingRect(self):
+        if self._cached_bounding is None:
+            self._cached_bounding = self._build_bounding_rect()
+        return self._cached_bounding
+
+    def _build_bounding_rect(self):
         # Build union of:
         #  - vertex bounding box
         #  - bounding rects of all child edge items
         rects = []
 
         if self.polygon.vertices:
-            minx = min(v.x for v in self.polygon.vertices)
-            miny = min(v.y for v in self.polygon.vertices)
-            maxx = max(v.x for v in self.polygon.vertices)
-            maxy = max(v.y for v in self.polygon.vertices)
-            top_left = self.mapFromScene(QPointF(minx, miny))
-            bottom_right = self.mapFromScene(QPointF(maxx, maxy))
-            rects.append(QRectF(top_left, bottom_right).normalized())
+            # Single pass over the vertices for all four extremes
+            vertices = iter(self.polygon.vertices)
+            v = next(vertices)
+            minx = maxx = v.x
+            miny = maxy = v.y
+            for v in vertices:
+                x = v.x
+                y = v.y
+                if x < minx:
+                    minx = x
+                elif x > maxx:
+                    maxx = x
+                if y < miny:
+                    miny = y
+                elif y > maxy:
+                    maxy = y
+            ox, oy = self._scene_origin()
+            rects.append(QRectF(minx - ox, miny - oy, maxx - minx, maxy - miny))
 
         # include child edge items' bounding rects
         for e_item in self.edge_items:
-            try:
-                r = e_item.boundingRect()
-            except Exception:
-                r = QRectF(0, 0, 0, 0)
+            r = e_item.boundingRect()
             if not r.isNull():
                 rects.append(r)
 
@@ -79,113 +289,72 @@ class PolygonItem(QGraphicsItem):
         return united.adjusted(-4, -4, 4, 4)
 
     def shape(self):
+        if self._cached_shape is None:
+            self._cached_shape = self._build_shape()
+        return self._cached_shape
+
+    # Must be called before vertices, control points or edges change, so Qt
+    # can update its index while the old geometry is still reported (an empty
+    # cache would be rebuilt from the already changed model)
+    def _invalidate_geometry(self):
+        self.prepareGeometryChange()
+        self._cached_shape = None
+        self._cached_bounding = None
+        self.shape_version += 1
+
+    def _build_shape(self):
         path = QPainterPath()
         edges = self.polygon.edges
         if not edges:
             return path
 
-        # Small helper local to mapping into parent coordinates
-        def to_parent(x: float, y: float) -> QPointF:
-            return self.mapFromScene(QPointF(x, y))
+        # Mapping into parent coordinates is a translation by the scene origin;
+        # coordinates go to the path as plain floats, without QPointFs
+        ox, oy = self._scene_origin()
 
         # Start path at first edge's v1
-        start = to_parent(edges[0].v1.x, edges[0].v1.y)
-        path.moveTo(start)
+        v = edges[0].v1
+        path.moveTo(v.x - ox, v.y - oy)
 
         for idx, e in enumerate(edges):
-            etype = getattr(e, "type", None)
+            etype = e.type
 
-            if etype == EdgeType.LINE:
-                path.lineTo(to_parent(e.v2.x, e.v2.y))
+            if etype == _LINE:
+                v = e.v2
+                path.lineTo(v.x - ox, v.y - oy)
                 continue
 
-            if etype == EdgeType.BEZIER:
+            if etype == _BEZIER:
                 # Use cubicTo for shape-based hit testing
-                c1 = to_parent(e.c1.x, e.c1.y)
-                c2 = to_parent(e.c2.x, e.c2.y)
-                p3 = to_parent(e.v2.x, e.v2.y)
-                path.cubicTo(c1, c2, p3)
+                c1, c2, v = e.c1, e.c2, e.v2
+                path.cubicTo(c1.x - ox, c1.y - oy, c2.x - ox, c2.y - oy, v.x - ox, v.y - oy)
                 continue
 
-            if etype == EdgeType.ARC:
-                # Approximate arc with polyline consistent with ArcEdgeItem
-                v1, v2 = e.v1, e.v2
-                x1, y1 = v1.x, v1.y
-                x2, y2 = v2.x, v2.y
-
-                chord_u, chord_len = unit(x2 - x1, y2 - y1)
-                if chord_u is None or chord_len < 1e-6:
+            if etype == _ARC:
+                # Arc through the circle solved by its ArcEdgeItem; recompute
+                # only if the item has not been updated since the last change
+                item = self.edge_items[idx] if idx < len(self.edge_items) else None
+                if isinstance(item, ArcEdgeItem) and item.edge is e:
+                    if item.geometry_version != self.shape_version:
+                        item.recompute_geometry()
+                    geometry = item.geometry
+                else:
+                    Cx, Cy, R, a_start, a_end, _ = compute_arc_geometry_for_edge(edges, idx, e)
+                    sweep = a_end - a_start
+                    geometry = (Cx, Cy, R, a_start, math.copysign(1.0, sweep), abs(sweep))
+                if geometry is None or geometry[2] < 1e-6 or geometry[5] < 1e-6:
                     # Degenerate: draw the chord
-                    path.lineTo(to_parent(e.v2.x, e.v2.y))
+                    path.lineTo(e.v2.x - ox, e.v2.y - oy)
                     continue
+                Cx, Cy, R, a1, sign, total_angle = geometry
 
-                # Continuity flags: only one end of a given arc may be G1
-                g1_v1 = getattr(v1, 'continuity', None) and v1.continuity.name == 'G1'
-                g1_v2 = getattr(v2, 'continuity', None) and v2.continuity.name == 'G1'
-                if g1_v1 and g1_v2:
-                    g1_v2 = False
-
-                # Base circle via chord mid-point and normal
-                Mx, My = (x1 + x2) * 0.5, (y1 + y2) * 0.5
-                ncx, ncy = rot90_ccw(*chord_u)
-                Cx, Cy = Mx, My
-                R = chord_len * 0.5
-                prefer_ccw = True
-
-                # If G1 at one endpoint, adjust center to match desired tangent
-                if g1_v1 or g1_v2:
-                    if g1_v1:
-                        t = neighbour_tangent(edges, idx, e, v1, True); Px, Py = x1, y1
-                    else:
-                        t = neighbour_tangent(edges, idx, e, v2, False); Px, Py = x2, y2
-                    if t is not None:
-                        ntx, nty = rot90_ccw(*t)
-                        mx, my = Mx - Px, My - Py
-                        det = ntx * (-ncy) - nty * (-ncx)
-                        if abs(det) > 1e-8:
-                            s = (mx * (-ncy) - my * (-ncx)) / det
-                            Cx, Cy = Px + s * ntx, Py + s * nty
-                            R = math.hypot(Px - Cx, Py - Cy)
-                            # Choose orientation so arc tangent matches desired t at endpoint
-                            rx, ry = Px - Cx, Py - Cy
-                            r_u, _ = unit(rx, ry)
-                            if r_u is not None:
-                                tx_ccw_x, tx_ccw_y = rot90_ccw(*r_u)
-                                tx_cw_x, tx_cw_y = (r_u[1], -r_u[0])
-                                dot_ccw = tx_ccw_x * t[0] + tx_ccw_y * t[1]
-                                dot_cw = tx_cw_x * t[0] + tx_cw_y * t[1]
-                                prefer_ccw = dot_ccw >= dot_cw
-
-                a1 = math.atan2(y1 - Cy, x1 - Cx)
-                a2 = math.atan2(y2 - Cy, x2 - Cx)
-                a1n, a2n = norm_angle(a1), norm_angle(a2)
-
-                if prefer_ccw:
-                    sweep = a2n - a1n
-                    if sweep <= 0:
-                        sweep += 2 * math.pi
-                    sign = 1.0
-                else:
-                    sweep = a1n - a2n
-                    if sweep <= 0:
-                        sweep += 2 * math.pi
-                    sweep = -sweep
-                    sign = -1.0
-
-                total_angle = abs(sweep)
-                samples = max(int(R * total_angle * 1.5), 24)
-                samples = min(samples, 1024)
-                dt = total_angle / samples if samples > 0 else total_angle
-
-                for i in range(1, samples + 1):
-                    a = a1 + sign * dt * i
-                    sx = Cx + R * math.cos(a)
-                    sy = Cy + R * math.sin(a)
-                    path.lineTo(to_parent(sx, sy))
+                # Exact enough for hit testing with at most four cubics
+                for segment in arc_cubic_segments(Cx - ox, Cy - oy, R, a1, sign, total_angle):
+                    path.cubicTo(*segment)
                 continue
 
             # Fallback for unknown type: draw straight line to v2
-            path.lineTo(to_parent(e.v2.x, e.v2.y))
+            path.lineTo(e.v2.x - ox, e.v2.y - oy)
 
         return path
     
@@ -193,8 +362,10 @@ class PolygonItem(QGraphicsItem):
         # Do not draw polygon edges here — EdgeItem children are responsible
         # for drawing their own representation (line / bresenham / bezier).
         # Optionally draw selection outline when selected:
+        # The outline is the hit-testing path, which shape() keeps cached
+        # until the next _invalidate_geometry(), so repaints do not rebuild it
         if self.isSelected():
-            painter.setPen(QPen(QColor("blue"), 1, Qt.DashLine))
+            painter.setPen(self._selection_pen)
             painter.drawPath(self.shape())
 
     def _setup_childitems(self):
@@ -203,56 +374,141 @@ class PolygonItem(QGraphicsItem):
         # look up edges by endpoint pairs.
         self._sync_edges_dict()
 
+        # Child items are diffed against the model: items of vertices and
+        # edges that are still present are kept, the rest is removed and
+        # only new vertices and edges get new items
+        sc = self.scene()
+        vertices = self.polygon.vertices
+        present = set(vertices)
+        for v in [v for v in self.vertex_items if v not in present]:
+            v_item = self.vertex_items.pop(v)
+            v_item.setParentItem(None)
+            if sc:
+                sc.removeItem(v_item)
+
+        ox, oy = self._scene_origin()
+        vertex_item_list = []
         self.updating_from_parent = True
         try:
             # Setting up VertexItems
-            for v in self.polygon.vertices:
-                v_item = VertexItem(v, parent=self)
+            for v in vertices:
                 # We convert vertex position from scene coordinates to parent 
                 # coordinates
-                vertex_parent_coords = self.mapFromScene(QPointF(v.x, v.y))
-                # "updating_from_parent" flag prevents from calling 
-                # parent.on_vertex_moved by children vertices (which whould
-                # cause the infinite loop) after the following setPos 
-                # method call
-                v_item.setPos(vertex_parent_coords)
-                self.vertex_items[v] = v_item
+                x = v.x - ox
+                y = v.y - oy
+                v_item = self.vertex_items.get(v)
+                if v_item is None:
+                    # New items are created in place
+                    v_item = VertexItem(v, parent=self, x=x, y=y)
+                    self.vertex_items[v] = v_item
+                else:
+                    # "updating_from_parent" flag prevents from calling 
+                    # parent.on_vertex_moved by children vertices (which whould
+                    # cause the infinite loop) after the following setPos 
+                    # method call
+                    v_item.setPos(x, y)
+                vertex_item_list.append(v_item)
         finally:
             self.updating_from_parent = False
-
-        # Setting up EdgeItems
+        self._vertex_item_list = vertex_item_list
+
+        # Setting up EdgeItems. Line items depend on the drawing mode, so they
+        # are only reused if the mode did not change since the last build
+        mode_changed = (
+            self._last_rebuild_sig is not None
+            and self._last_rebuild_sig[0] != self._line_drawing_mode
+        )
+        old_items = {e_item.edge: e_item for e_item in self.edge_items}
+        new_items = []
         for e in self.polygon.edges:
-            e_item = self.EdgeItemFactory(e, parent=self)
-            self.edge_items.append(e_item)
+            e_item = old_items.pop(e, None)
+            if e_item is None or (mode_changed and e.type == EdgeType.LINE):
+                if e_item is not None:
+                    old_items[e] = e_item
+                e_item = self.EdgeItemFactory(e, parent=self)
+            new_items.append(e_item)
+        for e_item in old_items.values():
+            e_item.setParentItem(None)
+            if sc:
+                sc.removeItem(e_item)
+        self.edge_items = new_items
+        for e_item in new_items:
             e_item.update_edge()
 
+        self._non_g0_vertices = {
+            v for v in self.polygon.vertices
+            if v.continuity is not None and v.continuity != ContinuityType.G0
+        }
+
+        self._last_rebuild_sig = self._childitems_signature()
+
+    # Structure the child items were built for: drawing mode plus identities
+    # of vertices and edges (an edge type change always creates a new Edge)
+    def _childitems_signature(self):
+        return (self._line_drawing_mode, tuple(self.polygon.vertices), tuple(self.polygon.edges))
+
+    # Moves existing child items to the current model positions. Only used
+    # while the structure matches the last build, so _vertex_item_list is
+    # still aligned with polygon.vertices
+    def _refresh_childitems(self):
+        ox, oy = self._scene_origin()
+        self.updating_from_parent = True
+        try:
+            for v, v_item in zip(self.polygon.vertices, self._vertex_item_list):
+                v_item.setPos(v.x - ox, v.y - oy)
+            for e_item in self.edge_items:
+                e_item.update_edge()
+            self._dirty_edges.clear()
+        finally:
+            self.updating_from_parent = False
+        self.update()
+
     def _rebuild_childitems(self):
-        # Remove all childitems
-        for child in list(self.childItems()):
-            child.setParentItem(None)
-            sc = self.scene()
-            if sc:
-                sc.removeItem(child)
-        self.vertex_items.clear()
-        self.edge_items.clear()
+        self._invalidate_geometry()
 
-        # Rebuild
+        # Recreating items is only needed when the structure changed since
+        # the last rebuild; otherwise refreshing them in place is enough
+        if self._childitems_signature() == self._last_rebuild_sig:
+            self._refresh_childitems()
+            return
+
+        # Bring the child items in line with the new structure
         self._setup_childitems()
         self.update()
 
     # convert_edge helper method
     def _replace_edge_at_index(self, idx: int, new_edge: Edge):
+        # Child items match the model as it is before the replacement
+        items_in_sync = self._childitems_signature() == self._last_rebuild_sig
+        self._invalidate_geometry()
         self.polygon.edges[idx] = new_edge
         # reset constraints on non-line edges
-        if getattr(new_edge, 'type', None) != EdgeType.LINE:
+        if new_edge.type != EdgeType.LINE:
             new_edge.constraint_type = ConstraintType.NONE
             new_edge.constraint_value = None
-        # sync edge dict and rebuild items
         self._sync_edges_dict()
-        self._rebuild_childitems()
+        if not items_in_sync:
+            self._rebuild_childitems()
+            return
+
+        # Only the replaced edge needs a new item; vertex items and the other
+        # edge items stay where they are
+        old_item = self.edge_items[idx]
+        old_item.setParentItem(None)
+        sc = self.scene()
+        if sc:
+            sc.removeItem(old_item)
+        self.edge_items[idx] = self.EdgeItemFactory(new_edge, parent=self)
+        self._last_rebuild_sig = self._childitems_signature()
+
+        # Redraw the new edge and the arcs bent by its tangents
+        self._mark_edges_around_vertex_dirty(new_edge.v1)
+        self._mark_edges_around_vertex_dirty(new_edge.v2)
+        self._flush_dirty_edges()
+        self.update()
 
     def convert_edge(self, edge: Edge, new_type: EdgeType):
-        idx = self.polygon.edges.index(edge)
+        idx = self.edge_index(edge)
         v1, v2 = edge.v1, edge.v2
         if new_type == EdgeType.LINE:
             new_edge = Edge(v1, v2)
@@ -273,86 +529,128 @@ class PolygonItem(QGraphicsItem):
             new_edge = Arc(v1, v2)
             self._replace_edge_at_index(idx, new_edge)
             # For arcs: enforce G0 at both endpoints
-            v1.continuity = ContinuityType.G0
-            v2.continuity = ContinuityType.G0
+            self._invalidate_geometry()
+            self._set_vertex_continuity(v1, ContinuityType.G0)
+            self._set_vertex_continuity(v2, ContinuityType.G0)
             # refresh visuals after continuity change
             self.edge_items[idx].update_edge()
             self.update()
 
     def _sync_edges_dict(self):
-        # Recreate mapping from (v1, v2) -> Edge for current polygon.edges
-        d = {}
-        for e in self.polygon.edges:
-            try:
-                # store both orientations to make lookups robust regardless
-                # of which vertex is passed first during propagation
-                d[(e.v1, e.v2)] = e
-                d[(e.v2, e.v1)] = e
-            except Exception:
-                # guard: skip malformed edges
-                continue
-        self.polygon.edges_dict = d
+        self._invalidate_geometry()
+
+        # Recreate mapping from {v1, v2} -> Edge for current polygon.edges;
+        # the unordered key finds the edge whichever vertex is passed first
+        # during propagation
+        self.polygon.edges_dict = {
+            frozenset((e.v1, e.v2)): e for e in self.polygon.edges
+        }
+
+        vertices = self.polygon.vertices
+        edges = self.polygon.edges
+        self._vertex_index = {v: i for i, v in enumerate(vertices)}
+        self._edge_index = {e: i for i, e in enumerate(edges)}
+        # The first edge ending (starting) at a vertex is its previous (next)
+        # edge
+        prev_edges = {}
+        next_edges = {}
+        for i, e in enumerate(edges):
+            prev_edges.setdefault(e.v2, (e, i))
+            next_edges.setdefault(e.v1, (e, i))
+        n = len(vertices)
+        n_edges = len(edges)
+        adjacent = {}
+        if n_edges:
+            for idx, v in enumerate(vertices):
+                prev_edge, prev_idx = prev_edges.get(v, (None, None))
+                next_edge, next_idx = next_edges.get(v, (None, None))
+                # If one side is missing (e.g., inconsistent orientation),
+                # infer it from edges[i] = (vertices[i] -> vertices[i+1])
+                if prev_edge is None:
+                    infer_prev_idx = (idx - 1) % n
+                    if infer_prev_idx < n_edges:
+                        prev_edge, prev_idx = edges[infer_prev_idx], infer_prev_idx
+                if next_edge is None and idx < n_edges:
+                    next_edge, next_idx = edges[idx], idx
+                adjacent[v] = (prev_edge, prev_idx, next_edge, next_idx)
+        self._adjacent_edges = adjacent
+
+        # Topology changed, so cached propagation chains are stale
+        self._propagation_chains.clear()
 
     def _edge_between(self, a: Vertex, b: Vertex) -> Edge | None:
-        return self.polygon.edges_dict.get((a, b)) or self.polygon.edges_dict.get((b, a))
+        return self.polygon.edges_dict.get(frozenset((a, b)))
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self._dragging = True
             self._drag_start_scene = event.scenePos()
+            self._drag_start_pos = self.pos()
             # We save original positions of vertices and control points
             self._original_vertices_positions = [(v, v.x, v.y) for v in self.polygon.vertices]
             self._original_control_positions = [(e, e.c1.x, e.c1.y, e.c2.x, e.c2.y) for e in self.polygon.edges if e.type == EdgeType.BEZIER]
+            # The model is only translated on release, so the cached geometry
+            # must exist before the item starts moving
+            self.boundingRect()
+            self.shape()
             event.accept()
         else:
             super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
         if self._dragging:
+            # Dragging is a rigid translation, so while the mouse moves only
+            # the item itself is moved. Children, cached shape and bounding
+            # rect are all in local coordinates and stay valid; the model is
+            # translated once on release
             delta = event.scenePos() - self._drag_start_scene
-            dx, dy = delta.x(), delta.y()
-
-            # We update original positions of vertices and control points
-            for v, ox, oy in self._original_vertices_positions:
-                v.x = ox + dx
-                v.y = oy + dy
-            for e, c1x, c1y, c2x, c2y in self._original_control_positions:
-                e.c1.x = c1x + dx
-                e.c1.y = c1y + dy
-                e.c2.x = c2x + dx
-                e.c2.y = c2y + dy
-
-            self.updating_from_parent = True
-            try:
-                for v, v_item in self.vertex_items.items():
-                    # We convert new vertex position from scene coordinates to 
-                    # parent coordinates
-                    vertex_new_parent_coords = self.mapFromScene(QPointF(v.x, v.y))
-                    # "updating_from_parent" flag prevents from calling 
-                    # parent.on_vertex_moved by children vertices (which whould
-                    # cause the infinite loop) after the following setPos 
-                    # method call
-                    v_item.setPos(vertex_new_parent_coords)
-                for e_item in self.edge_items:
-                    e_item.update_edge()
-            finally:
-                self.updating_from_parent = False
-
-            self.update()
+            self.setPos(self._drag_start_pos + delta)
             event.accept()
         else:
             return super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.LeftButton and self._dragging:
-            self._dragging = False
-            self._drag_start_scene = None
-            self._original_vertices_positions = None
-            self._original_control_positions = None
+            self._commit_drag()
             event.accept()
         else:
             super().mouseReleaseEvent(event)
 
+    # The grab can also be lost without a release (e.g. a dialog opens or the
+    # window loses focus mid-drag); the drag still has to reach the model.
+    # PySide6 does not expose ungrabMouseEvent() for overriding, so the
+    # UngrabMouse event is caught here
+    def sceneEvent(self, event):
+        if self._dragging and event.type() == QEvent.Type.UngrabMouse:
+            self._commit_drag()
+        return super().sceneEvent(event)
+
+    # Ends a polygon drag by shifting the model by the distance the item was
+    # moved, so model and item position agree again
+    def _commit_drag(self):
+        # We shift original positions of vertices and control points by
+        # the distance the item was moved
+        delta = self.pos() - self._drag_start_pos
+        dx, dy = delta.x(), delta.y()
+        for v, ox, oy in self._original_vertices_positions:
+            v.x = ox + dx
+            v.y = oy + dy
+        for e, c1x, c1y, c2x, c2y in self._original_control_positions:
+            e.c1.x = c1x + dx
+            e.c1.y = c1y + dy
+            e.c2.x = c2x + dx
+            e.c2.y = c2y + dy
+        # Edge items keep their local drawing, this only brings state
+        # derived from scene coordinates (e.g. arc circles) up to date
+        for e_item in self.edge_items:
+            e_item.update_edge()
+
+        self._dragging = False
+        self._drag_start_scene = None
+        self._original_vertices_positions = None
+        self._original_control_positions = None
+        self._drag_start_pos = None
+
     def EdgeItemFactory(self, edge: Edge, parent):
         if edge.type == EdgeType.LINE:
             if self._line_drawing_mode == LineDrawingMode.QGRAPHICS:
@@ -364,212 +662,114 @@ class PolygonItem(QGraphicsItem):
         elif edge.type == EdgeType.ARC:
             return ArcEdgeItem(edge, parent)
 
-    # Method called by VertexItem when user directly drags a single vertex
-    def on_vertex_moved(self, vertex: Vertex, vertex_new_scene_coords: QPointF):
-        vertex.x = vertex_new_scene_coords.x()
-        vertex.y = vertex_new_scene_coords.y()
+    # Method called by VertexItem when user directly drags a single vertex.
+    # Without new coordinates the vertex is taken to be already updated in the
+    # model
+    def on_vertex_moved(self, vertex: Vertex, vertex_new_scene_coords: QPointF | None = None):
+        self._invalidate_geometry()
+        if vertex_new_scene_coords is not None:
+            vertex.x = vertex_new_scene_coords.x()
+            vertex.y = vertex_new_scene_coords.y()
 
         # Propagate constraints in both directions around the polygon (circular)
-        n = len(self.polygon.vertices)
-        if n > 1:
-            # Rightwards propagation (increasing index, wrap-around)
-            idx = self.polygon.vertices.index(vertex)
-            i = idx
-            while True:
-                j = (i + 1) % n
-                if j == idx:
-                    break
-                v1 = self.polygon.vertices[i]
-                v2 = self.polygon.vertices[j]
-                continue_propagation = self._enforce_edge_constraint(v1, v2)
-                if not continue_propagation:
-                    break
-                i = j
-
-            # Leftwards propagation (decreasing index, wrap-around)
-            i = idx
-            while True:
-                j = (i - 1) % n
-                if j == idx:
-                    break
-                v1 = self.polygon.vertices[i]
-                v2 = self.polygon.vertices[j]
-                continue_propagation = self._enforce_edge_constraint(v1, v2)
-                if not continue_propagation:
-                    break
-                i = j
-        
-        # Updating the visuals
+        rightwards_chain, leftwards_chain = self._propagation_chains_of_vertex(vertex)
+        chain_vertices = [v2 for _, _, v2 in rightwards_chain]
+        chain_vertices.extend(v2 for _, _, v2 in leftwards_chain)
+        old_positions = [(v.x, v.y) for v in chain_vertices]
+        for edge, v1, v2 in rightwards_chain:
+            self._enforce_edge_constraint(edge, v1, v2)
+        for edge, v1, v2 in leftwards_chain:
+            self._enforce_edge_constraint(edge, v1, v2)
+
+        # Updating the visuals of the vertices that actually moved and of the
+        # edges around them; a constraint that already held (e.g. a vertical
+        # edge while dragging vertically) leaves its far vertex in place
+        moved = [vertex]
+        moved.extend(
+            v for v, (x, y) in zip(chain_vertices, old_positions)
+            if v.x != x or v.y != y
+        )
+        ox, oy = self._scene_origin()
         self.updating_from_parent = True
         try:
-            for v, v_item in self.vertex_items.items():
-                vertex_parent_coords = self.mapFromScene(QPointF(v.x, v.y))
-                v_item.setPos(vertex_parent_coords)
-            for e_item in self.edge_items:
-                e_item.update_edge()
+            for v in moved:
+                self.vertex_items[v].setPos(v.x - ox, v.y - oy)
+                self._mark_edges_around_vertex_dirty(v)
         finally:
             self.updating_from_parent = False
 
-        # Enforce continuity constraints for any vertices that requested it
-        for v in self.polygon.vertices:
-            if v.continuity is not None and v.continuity != ContinuityType.G0:
-                self.enforce_vertex_continuity_from_vertex(v)
+        # Enforce continuity constraints for any vertices that requested it;
+        # the edges they touch join the dirty set and everything is redrawn
+        # once
+        for v in self._non_g0_vertices_in_order():
+            self.enforce_vertex_continuity_from_vertex(v, defer_update=True)
+        self._flush_dirty_edges()
 
         self.update()
 
-    def _enforce_edge_constraint(self, v1: Vertex, v2: Vertex) -> bool:
-        current_edge = self._edge_between(v1, v2)
-        # If we couldn't find an edge connecting v1 and v2, stop propagation
-        if current_edge is None:
-            return False
-        # If edge has no constraint, stop propagation
-        if current_edge.constraint_type == ConstraintType.NONE:
-            return False
-        elif current_edge.constraint_type == ConstraintType.VERTICAL:
-            v2.x = v1.x
-        elif current_edge.constraint_type == ConstraintType.FIXED_LENGTH:
-            L = current_edge.constraint_value
-            dx = v2.x - v1.x
-            dy = v2.y - v1.y
-            dist = (dx*dx + dy*dy) ** 0.5
-            if dist == 0:
-                v2.x = v1.x + L
-                v2.y = v1.y
-            else:
-                scale = L / dist
-                v2.x = v1.x + dx * scale
-                v2.y = v1.y + dy * scale
-        elif current_edge.constraint_type == ConstraintType.DIAGONAL_45:
-            # Project direction to nearest 45° while preserving current Euclidean length
-            dx = v2.x - v1.x
-            dy = v2.y - v1.y
-            dist = math.hypot(dx, dy)
-            if dist < 1e-8:
-                # If degenerate, keep a small step in the quadrant inferred by neighbors
-                sx = 1 if dx >= 0 else -1
-                sy = 1 if dy >= 0 else -1
-                inv_sqrt2 = 1.0 / math.sqrt(2.0)
-                ux = sx * inv_sqrt2
-                uy = sy * inv_sqrt2
-                step = 1.0
-                v2.x = v1.x + ux * step
-                v2.y = v1.y + uy * step
-            else:
-                sx = 1 if dx >= 0 else -1
-                sy = 1 if dy >= 0 else -1
-                inv_sqrt2 = 1.0 / math.sqrt(2.0)
-                ux = sx * inv_sqrt2
-                uy = sy * inv_sqrt2
-                v2.x = v1.x + ux * dist
-                v2.y = v1.y + uy * dist
-        else:
-            return False
-
-        return True
-
-    def adjacent_edges_of_vertex(self, vertex: Vertex):
-        if vertex not in self.polygon.vertices:
-            return (None, None, None, None)
+    # Returns the (edge, v1, v2) steps visited when a move of the given vertex
+    # is propagated rightwards and leftwards around the polygon. The chains
+    # depend only on the constraint layout, so they are built once per vertex
+    # and dropped whenever constraints or topology change
+    def _propagation_chains_of_vertex(self, vertex: Vertex):
+        chains = self._propagation_chains.get(vertex)
+        if chains is None:
+            idx = self._vertex_index[vertex]
+            chains = (
+                self._build_propagation_chain(idx, 1),
+                self._build_propagation_chain(idx, -1),
+            )
+            self._propagation_chains[vertex] = chains
+        return chains
+
+    def _build_propagation_chain(self, idx: int, step: int):
+        vertices = self.polygon.vertices
+        n = len(vertices)
+        chain = []
+        i = idx
+        while True:
+            j = (i + step) % n
+            if j == idx:
+                break
+            v1 = vertices[i]
+            v2 = vertices[j]
+            edge = self._edge_between(v1, v2)
+            # Propagation stops at the first edge without a constraint
+            if edge is None or edge.constraint_type == _NO_CONSTRAINT:
+                break
+            chain.append((edge, v1, v2))
+            i = j
+        return chain
+
+    def _enforce_edge_constraint(self, current_edge: Edge, v1: Vertex, v2: Vertex) -> bool:
+        # Edges without a constraint (no entry in the table) stop propagation
+        fn = _CONSTRAINT_FNS.get(current_edge.constraint_type)
+        return fn is not None and fn(v1, v2, current_edge)
+
+    # Index of the edge in polygon.edges, or None if it is not part of the
+    # polygon. Falls back to a scan if the edge list was edited since the
+    # last _sync_edges_dict()
+    def edge_index(self, edge: Edge) -> int | None:
         edges = self.polygon.edges
-        n_edges = len(edges)
-        if n_edges == 0:
-            return (None, None, None, None)
-
-        incident = [e for e in edges if getattr(e, 'v1', None) is vertex or getattr(e, 'v2', None) is vertex]
-        prev_edge = next_edge = None
-        prev_idx = next_idx = None
-
-        if incident:
-            for e in incident:
-                if getattr(e, 'v2', None) is vertex and prev_edge is None:
-                    prev_edge = e
-                    try:
-                        prev_idx = edges.index(e)
-                    except ValueError:
-                        prev_idx = None
-                if getattr(e, 'v1', None) is vertex and next_edge is None:
-                    next_edge = e
-                    try:
-                        next_idx = edges.index(e)
-                    except ValueError:
-                        next_idx = None
-
-        # If one side is still missing (e.g., inconsistent orientation), try to infer
-        if (prev_edge is None or next_edge is None) and vertex in self.polygon.vertices:
-            n = len(self.polygon.vertices)
-            idx = self.polygon.vertices.index(vertex)
-            # Expected mapping: edges[i] = (vertices[i] -> vertices[(i+1)%n])
-            infer_prev_idx = (idx - 1) % n
-            infer_next_idx = idx % n
-            if prev_edge is None and 0 <= infer_prev_idx < n_edges:
-                prev_edge = edges[infer_prev_idx]
-                prev_idx = infer_prev_idx
-            if next_edge is None and 0 <= infer_next_idx < n_edges:
-                next_edge = edges[infer_next_idx]
-                next_idx = infer_next_idx
-
-        return (prev_edge, prev_idx, next_edge, next_idx)
-
-    def _project_direction_to_constraint(
-        self,
-        vertex: Vertex,
-        other_vertex: Vertex,
-        desired_dir: tuple[float, float] | None,
-        constraint_type: ConstraintType,
-        constraint_value,
-    ) -> tuple[tuple[float, float], float]:
-        vx = vertex.x
-        vy = vertex.y
-        dx = other_vertex.x - vx
-        dy = other_vertex.y - vy
-        _, current_len = normalize_vector((dx, dy))
-        if current_len < 1e-8:
-            if constraint_type == ConstraintType.FIXED_LENGTH and constraint_value:
-                current_len = abs(constraint_value)
-            else:
-                current_len = 1.0
-
-        if desired_dir is None:
-            desired_dir = (dx, dy)
-
-        dir_norm, _ = normalize_vector(desired_dir)
-        if dir_norm is None:
-            dir_norm, _ = normalize_vector((dx, dy))
-        if dir_norm is None:
-            dir_norm = (1.0, 0.0)
-
-        ux, uy = dir_norm
-
-        if constraint_type == ConstraintType.VERTICAL:
-            sign = -1.0 if uy < 0 else 1.0 if uy > 0 else (-1.0 if dy < 0 else 1.0)
-            ux = 0.0
-            uy = sign
-            base_len = current_len
-        elif constraint_type == ConstraintType.DIAGONAL_45:
-            sx = -1.0 if ux < 0 else 1.0 if ux > 0 else (-1.0 if dx < 0 else 1.0)
-            sy = -1.0 if uy < 0 else 1.0 if uy > 0 else (-1.0 if dy < 0 else 1.0)
-            factor = 1.0 / math.sqrt(2.0)
-            ux = sx * factor
-            uy = sy * factor
-            base_len = current_len
-        elif constraint_type == ConstraintType.FIXED_LENGTH:
-            base_len = abs(constraint_value) if constraint_value is not None else current_len
-            if base_len < 1e-8:
-                base_len = current_len if current_len > 1e-8 else 1.0
-        else:
-            base_len = current_len
+        idx = self._edge_index.get(edge)
+        if idx is not None and idx < len(edges) and edges[idx] is edge:
+            return idx
+        try:
+            return edges.index(edge)
+        except ValueError:
+            return None
 
-        return (ux, uy), base_len
+    def adjacent_edges_of_vertex(self, vertex: Vertex):
+        return self._adjacent_edges.get(vertex, (None, None, None, None))
 
     # --- Arc helpers for continuity with Bezier ---
     def _arc_tangent_at_vertex(self, arc_edge: Edge, at_v1: bool) -> tuple[float, float] | None:
-        if getattr(arc_edge, 'type', None) != EdgeType.ARC:
+        if arc_edge.type != _ARC:
             return None
 
         # locate index of this arc to access neighbours in polygon order
-        try:
-            idx = self.polygon.edges.index(arc_edge)
-        except ValueError:
+        idx = self.edge_index(arc_edge)
+        if idx is None:
             return None
         n_edges = len(self.polygon.edges)
 
@@ -582,72 +782,55 @@ class PolygonItem(QGraphicsItem):
             return None
 
         # continuity flags (only one end may be G1)
-        g1_v1 = getattr(v1, 'continuity', None) == ContinuityType.G1
-        g1_v2 = getattr(v2, 'continuity', None) == ContinuityType.G1
+        g1_v1 = v1.continuity == _G1
+        g1_v2 = v2.continuity == _G1
         if g1_v1 and g1_v2:
             # honor only v1 per rule
             g1_v2 = False
 
         Mx = (x1 + x2) * 0.5
         My = (y1 + y2) * 0.5
-        ncx, ncy = rot90_ccw(*chord_u)
+        ncx, ncy = -chord_u[1], chord_u[0]
 
         Cx, Cy = Mx, My
-        R = chord_len * 0.5
         prefer_ccw = True
 
-        # tangent from neighbour edge at the chosen endpoint if G1
-        def neighbour_tangent_for_arc(at_v1_local: bool):
-            # For v1 use edge before arc; for v2 use edge after arc
-            if at_v1_local:
-                ne = self.polygon.edges[(idx - 1) % n_edges]
-                vertex = v1
-                # direction along neighbour at vertex
-                if ne.v2 is vertex:
-                    vx = vertex.x - ne.v1.x; vy = vertex.y - ne.v1.y
-                else:
-                    vx = ne.v2.x - vertex.x; vy = ne.v2.y - vertex.y
-                if getattr(ne, 'type', None) == EdgeType.BEZIER:
-                    try:
-                        vx = vertex.x - ne.c2.x; vy = vertex.y - ne.c2.y
-                    except Exception:
-                        pass
-            else:
-                ne = self.polygon.edges[(idx + 1) % n_edges]
-                vertex = v2
-                if ne.v1 is vertex:
-                    vx = ne.v2.x - vertex.x; vy = ne.v2.y - vertex.y
-                else:
-                    vx = vertex.x - ne.v1.x; vy = vertex.y - ne.v1.y
-                if getattr(ne, 'type', None) == EdgeType.BEZIER:
-                    try:
-                        vx = ne.c1.x - vertex.x; vy = ne.c1.y - vertex.y
-                    except Exception:
-                        pass
-            u, _ = unit(vx, vy)
-            return u
-
+        # tangent from neighbour edge at the chosen endpoint if G1: for v1 the
+        # edge before the arc, for v2 the edge after it
         if g1_v1 or g1_v2:
+            edges = self.polygon.edges
             if g1_v1:
-                t = neighbour_tangent_for_arc(True); Px, Py = x1, y1
+                ne = edges[(idx - 1) % n_edges]
+                Px, Py = x1, y1
+                if ne.type == _BEZIER:
+                    vx = x1 - ne.c2.x; vy = y1 - ne.c2.y
+                elif ne.v2 is v1:
+                    vx = x1 - ne.v1.x; vy = y1 - ne.v1.y
+                else:
+                    vx = ne.v2.x - x1; vy = ne.v2.y - y1
             else:
-                t = neighbour_tangent_for_arc(False); Px, Py = x2, y2
+                ne = edges[(idx + 1) % n_edges]
+                Px, Py = x2, y2
+                if ne.type == _BEZIER:
+                    vx = ne.c1.x - x2; vy = ne.c1.y - y2
+                elif ne.v1 is v2:
+                    vx = ne.v2.x - x2; vy = ne.v2.y - y2
+                else:
+                    vx = x2 - ne.v1.x; vy = y2 - ne.v1.y
+            t, _ = unit(vx, vy)
             if t is not None:
-                ntx, nty = rot90_ccw(*t)
+                ntx, nty = -t[1], t[0]
                 mx = Mx - Px; my = My - Py
                 det = ntx * (-ncy) - nty * (-ncx)
                 if abs(det) > 1e-8:
                     s = (mx * (-ncy) - my * (-ncx)) / det
                     Cx = Px + s * ntx; Cy = Py + s * nty
-                    R = math.hypot(Px - Cx, Py - Cy)
                     rx = Px - Cx; ry = Py - Cy
                     r_u, _ = unit(rx, ry)
                     if r_u is not None:
-                        t_ccw = rot90_ccw(*r_u)
-                        t_cw = rot90_cw(*r_u)
-                        dot_ccw = t_ccw[0] * t[0] + t_ccw[1] * t[1]
-                        dot_cw = t_cw[0] * t[0] + t_cw[1] * t[1]
-                        prefer_ccw = dot_ccw >= dot_cw
+                        # The CW tangent is the negated CCW one (-r_u.y, r_u.x),
+                        # so comparing their dot products with t is a sign test
+                        prefer_ccw = r_u[0] * t[1] - r_u[1] * t[0] >= 0
 
         # tangent at requested vertex along polygon direction
         if at_v1:
@@ -657,10 +840,8 @@ class PolygonItem(QGraphicsItem):
         r_u, _ = unit(rx, ry)
         if r_u is None:
             return None
-        if prefer_ccw:
-            return rot90_ccw(*r_u)
-        else:
-            return (-rot90_ccw(*r_u)[0], -rot90_ccw(*r_u)[1])  # rot90_cw
+        rux, ruy = r_u
+        return (-ruy, rux) if prefer_ccw else (ruy, -rux)
 
     def apply_continuity_to_vertex(self, vertex: Vertex, continuity: ContinuityType) -> bool:
         # Now applicable when at least one adjacent edge is Bezier or Arc
@@ -687,11 +868,11 @@ class PolygonItem(QGraphicsItem):
             conflicts = []
             if t1 == EdgeType.ARC and prev_edge is not None:
                 other = prev_edge.v2 if prev_edge.v1 is vertex else prev_edge.v1
-                if getattr(other, 'continuity', None) == ContinuityType.G1:
+                if other.continuity == ContinuityType.G1:
                     conflicts.append(prev_edge)
             if t2 == EdgeType.ARC and next_edge is not None:
                 other = next_edge.v2 if next_edge.v1 is vertex else next_edge.v1
-                if getattr(other, 'continuity', None) == ContinuityType.G1:
+                if other.continuity == ContinuityType.G1:
                     conflicts.append(next_edge)
             if conflicts:
                 # Warn and reject
@@ -702,8 +883,9 @@ class PolygonItem(QGraphicsItem):
                 self.last_continuity_warning = msg
                 return False
 
-        # Set continuity on the vertex
-        vertex.continuity = continuity
+        # Set continuity on the vertex (arcs bend according to it)
+        self._invalidate_geometry()
+        self._set_vertex_continuity(vertex, continuity)
 
         # Enforce immediately for Bezier-related cases; for Arc-related
         # cases, enforcement is handled implicitly by ArcEdgeItem geometry,
@@ -712,80 +894,79 @@ class PolygonItem(QGraphicsItem):
             self.enforce_vertex_continuity_from_vertex(vertex)
 
         # Update visuals for affected edges
-        try:
-            self.edge_items[prev_idx].update_edge()
-            self.edge_items[next_idx].update_edge()
-            self.update()
-        except Exception:
-            pass
+        self.edge_items[prev_idx].update_edge()
+        self.edge_items[next_idx].update_edge()
+        self.update()
         return True
     
+    def _set_vertex_continuity(self, vertex: Vertex, continuity: ContinuityType):
+        vertex.continuity = continuity
+        if continuity is not None and continuity != _G0:
+            self._non_g0_vertices.add(vertex)
+        else:
+            self._non_g0_vertices.discard(vertex)
+
+    # Turns a Bezier handle at the vertex along the tangent of the adjacent
+    # arc, keeping its length. at_v1 tells whether the arc starts at the
+    # vertex; the handle then belongs to the edge before it and points
+    # against the tangent. Returns whether the handle was moved
+    def _align_handle_to_arc(self, vertex: Vertex, handle: Vertex, arc_edge: Edge, at_v1: bool) -> bool:
+        vx = vertex.x
+        vy = vertex.y
+        length = hypot(handle.x - vx, handle.y - vy)
+        if length <= 1e-8:
+            return False
+        t = self._arc_tangent_at_vertex(arc_edge, at_v1=at_v1)
+        if t is None:
+            return False
+        _place_handle(handle, vx, vy, t[0], t[1], -length if at_v1 else length)
+        return True
+
+    # Non-G0 vertices in polygon order, so enforcement does not depend on
+    # set iteration order
+    def _non_g0_vertices_in_order(self):
+        return sorted(self._non_g0_vertices, key=self._vertex_index.__getitem__)
+
     # Metoda wywoływana przez _on_vertex_moved oraz apply_continuity_to_vertex.
     # Modyfikuje punkt kontrolny krzywej beziera związanej z wierzchołkiem, tak,
     # aby zachować przypisaną ciągłość dla tego wierzchołka (modyfikujemy tylko
     # pozycję punktu kontrolnego)
-    def enforce_vertex_continuity_from_vertex(self, vertex: Vertex) -> None:
+    def enforce_vertex_continuity_from_vertex(self, vertex: Vertex, defer_update: bool = False) -> None:
         prev_edge, prev_idx, next_edge, next_idx = self.adjacent_edges_of_vertex(vertex)
         if prev_edge is None or next_edge is None:
             return
 
-        cont = getattr(vertex, 'continuity', None)
-        if cont is None or cont == ContinuityType.G0:
+        cont = vertex.continuity
+        if cont is None or cont == _G0:
             return
 
+        self._invalidate_geometry()
+
         # Coordinates
         vx = vertex.x
         vy = vertex.y
 
-        prev_is_bezier = getattr(prev_edge, 'type', None) == EdgeType.BEZIER
-        next_is_bezier = getattr(next_edge, 'type', None) == EdgeType.BEZIER
+        prev_is_bezier = prev_edge.type == _BEZIER
+        next_is_bezier = next_edge.type == _BEZIER
 
         # Case A: both Bezier (existing behavior)
         if prev_is_bezier and next_is_bezier:
             prev_c2 = prev_edge.c2
             next_c1 = next_edge.c1
 
-            pvx = vx - prev_c2.x
-            pvy = vy - prev_c2.y
-            prev_len = math.hypot(pvx, pvy)
-            nvx = next_c1.x - vx
-            nvy = next_c1.y - vy
-            next_len = math.hypot(nvx, nvy)
-
-            if cont == ContinuityType.G1:
+            if cont == _G1:
                 # align unit tangent vectors; preserve handle lengths
-                if prev_len > 1e-8:
-                    ux = pvx / prev_len
-                    uy = pvy / prev_len
-                    # set next.c1 to point in same direction with its original length
-                    next_edge.c1.x = vx + ux * next_len
-                    next_edge.c1.y = vy + uy * next_len
-                    # ensure prev control is aligned too (snap to exact opposite direction preserving length)
-                    prev_edge.c2.x = vx - ux * prev_len
-                    prev_edge.c2.y = vy - uy * prev_len
-                elif next_len > 1e-8:
-                    ux = nvx / next_len
-                    uy = nvy / next_len
-                    prev_edge.c2.x = vx - ux * prev_len
-                    prev_edge.c2.y = vy - uy * prev_len
-            elif cont == ContinuityType.C1:
-                # enforce equality of tangent vectors: (v - prev.c2) == (next.c1 - v)
+                _align_bezier_handles_g1(vx, vy, prev_c2, next_c1)
+            elif cont == _C1:
+                # enforce equality of tangent vectors: (v - prev.c2) == (next.c1 - v).
+                # Only next.c1 moves: reflecting it back would give prev.c2 again
                 next_edge.c1.x = 2 * vx - prev_c2.x
                 next_edge.c1.y = 2 * vy - prev_c2.y
-                prev_edge.c2.x = 2 * vx - next_edge.c1.x
-                prev_edge.c2.y = 2 * vy - next_edge.c1.y
 
         # Case B1: prev is Bezier, next is ARC — align Bezier handle to arc tangent
-        elif prev_is_bezier and getattr(next_edge, 'type', None) == EdgeType.ARC:
-            prev_c2 = prev_edge.c2
-            pvx = vx - prev_c2.x
-            pvy = vy - prev_c2.y
-            prev_len = math.hypot(pvx, pvy)
-            if cont == ContinuityType.G1 and prev_len > 1e-8:
-                t = self._arc_tangent_at_vertex(next_edge, at_v1=True)
-                if t is not None:
-                    prev_edge.c2.x = vx - t[0] * prev_len
-                    prev_edge.c2.y = vy - t[1] * prev_len
+        elif prev_is_bezier and next_edge.type == _ARC:
+            if cont == _G1:
+                self._align_handle_to_arc(vertex, prev_edge.c2, next_edge, at_v1=True)
 
         # Case B2: prev is Bezier, next is LINE
         elif prev_is_bezier and not next_is_bezier:
@@ -793,37 +974,31 @@ class PolygonItem(QGraphicsItem):
             other = next_edge.v2
             lvx = other.x - vx
             lvy = other.y - vy
-            l_len = math.hypot(lvx, lvy)
+            l_len = hypot(lvx, lvy)
             prev_c2 = prev_edge.c2
             pvx = vx - prev_c2.x
             pvy = vy - prev_c2.y
-            prev_len = math.hypot(pvx, pvy)
+            prev_len = hypot(pvx, pvy)
 
             if l_len < 1e-8:
                 return
 
-            if cont == ContinuityType.G1:
-                ux = lvx / l_len
-                uy = lvy / l_len
+            if cont == _G1:
+                inv = 1.0 / l_len
+                ux = lvx * inv
+                uy = lvy * inv
                 # align prev handle direction with line direction, preserve prev handle length
                 prev_edge.c2.x = vx - ux * prev_len
                 prev_edge.c2.y = vy - uy * prev_len
-            elif cont == ContinuityType.C1:
+            elif cont == _C1:
                 # set prev.c2 so that (v - prev.c2) == (other - v)
                 prev_edge.c2.x = vx - lvx
                 prev_edge.c2.y = vy - lvy
 
         # Case C1: prev is ARC, next is Bezier — align Bezier handle to arc tangent
-        elif getattr(prev_edge, 'type', None) == EdgeType.ARC and next_is_bezier:
-            next_c1 = next_edge.c1
-            nvx = next_c1.x - vx
-            nvy = next_c1.y - vy
-            next_len = math.hypot(nvx, nvy)
-            if cont == ContinuityType.G1 and next_len > 1e-8:
-                t = self._arc_tangent_at_vertex(prev_edge, at_v1=False)
-                if t is not None:
-                    next_edge.c1.x = vx + t[0] * next_len
-                    next_edge.c1.y = vy + t[1] * next_len
+        elif prev_edge.type == _ARC and next_is_bezier:
+            if cont == _G1:
+                self._align_handle_to_arc(vertex, next_edge.c1, prev_edge, at_v1=False)
 
         # Case C2: prev is LINE, next is Bezier
         elif not prev_is_bezier and next_is_bezier:
@@ -831,35 +1006,38 @@ class PolygonItem(QGraphicsItem):
             other = prev_edge.v1
             lvx = vx - other.x
             lvy = vy - other.y
-            l_len = math.hypot(lvx, lvy)
+            l_len = hypot(lvx, lvy)
             next_c1 = next_edge.c1
             nvx = next_c1.x - vx
             nvy = next_c1.y - vy
-            next_len = math.hypot(nvx, nvy)
+            next_len = hypot(nvx, nvy)
 
             if l_len < 1e-8:
                 return
 
-            if cont == ContinuityType.G1:
-                ux = lvx / l_len
-                uy = lvy / l_len
+            if cont == _G1:
+                inv = 1.0 / l_len
+                ux = lvx * inv
+                uy = lvy * inv
                 # align next handle direction with line direction, preserve next handle length
                 next_edge.c1.x = vx + ux * next_len
                 next_edge.c1.y = vy + uy * next_len
-            elif cont == ContinuityType.C1:
+            elif cont == _C1:
                 # set next.c1 so that (next.c1 - v) == (v - other)
                 next_edge.c1.x = vx + lvx
                 next_edge.c1.y = vy + lvy
 
         # else: both not Bezier (shouldn't happen due to apply check)
 
-        # After modifications, update visuals of affected edge items
-        try:
-            self.edge_items[prev_idx].update_edge()
-            self.edge_items[next_idx].update_edge()
-            self.update()
-        except Exception:
-            pass
+        # After modifications, update visuals of affected edge items (or
+        # leave them to the caller's _flush_dirty_edges())
+        if defer_update:
+            self._dirty_edges.add(prev_idx)
+            self._dirty_edges.add(next_idx)
+            return
+        self.edge_items[prev_idx].update_edge()
+        self.edge_items[next_idx].update_edge()
+        self.update()
     
     # Metoda wywoływana przez on_control_moved w BezierEdgeItem. Modyfikuje 
     # wierzchołek sąsiadujący z wierzchołkiem vertex po przesunięciu punktu
@@ -871,58 +1049,31 @@ class PolygonItem(QGraphicsItem):
         if prev_edge is None or next_edge is None:
             return
 
-        cont = getattr(vertex, 'continuity', None)
-        if cont is None or cont == ContinuityType.G0:
+        cont = vertex.continuity
+        if cont is None or cont == _G0:
             return
 
         vx = vertex.x
         vy = vertex.y
 
-        prev_is_bezier = prev_edge.type == EdgeType.BEZIER
-        next_is_bezier = next_edge.type == EdgeType.BEZIER
+        prev_is_bezier = prev_edge.type == _BEZIER
+        next_is_bezier = next_edge.type == _BEZIER
 
         moved_vertices = []
+        # Set by every branch that actually writes a handle or a vertex
+        adjusted = False
 
         # Case A: both Bezier — follow the moved handle as the driver
         if prev_is_bezier and next_is_bezier:
             prev_c2 = prev_edge.c2
             next_c1 = next_edge.c1
 
-            pvx = vx - prev_c2.x
-            pvy = vy - prev_c2.y
-            prev_len = math.hypot(pvx, pvy)
-            nvx = next_c1.x - vx
-            nvy = next_c1.y - vy
-            next_len = math.hypot(nvx, nvy)
-
-            if cont == ContinuityType.G1:
+            if cont == _G1:
                 # Keep the moved side direction and align the other side to it
-                if moved_control == 'prev' and prev_len > 1e-8:
-                    ux = pvx / prev_len
-                    uy = pvy / prev_len
-                    next_edge.c1.x = vx + ux * max(next_len, 1e-8)
-                    next_edge.c1.y = vy + uy * max(next_len, 1e-8)
-                elif moved_control == 'next' and next_len > 1e-8:
-                    ux = nvx / next_len
-                    uy = nvy / next_len
-                    prev_edge.c2.x = vx - ux * max(prev_len, 1e-8)
-                    prev_edge.c2.y = vy - uy * max(prev_len, 1e-8)
-                else:
-                    # Fallback to previous heuristic if moved_control unknown
-                    if prev_len > 1e-8:
-                        ux = pvx / prev_len
-                        uy = pvy / prev_len
-                        next_edge.c1.x = vx + ux * next_len
-                        next_edge.c1.y = vy + uy * next_len
-                        prev_edge.c2.x = vx - ux * prev_len
-                        prev_edge.c2.y = vy - uy * prev_len
-                    elif next_len > 1e-8:
-                        ux = nvx / next_len
-                        uy = nvy / next_len
-                        prev_edge.c2.x = vx - ux * prev_len
-                        prev_edge.c2.y = vy - uy * prev_len
-            elif cont == ContinuityType.C1:
+                adjusted = _align_bezier_handles_g1(vx, vy, prev_c2, next_c1, moved_control)
+            elif cont == _C1:
                 # Reflect across vertex; preserve the moved handle as-is
+                adjusted = True
                 if moved_control == 'prev':
                     # user moved prev.c2 -> set next.c1 as reflection
                     next_edge.c1.x = 2 * vx - prev_c2.x
@@ -932,37 +1083,29 @@ class PolygonItem(QGraphicsItem):
                     prev_edge.c2.x = 2 * vx - next_edge.c1.x
                     prev_edge.c2.y = 2 * vy - next_edge.c1.y
                 else:
-                    # Unknown driver -> symmetric reflection (legacy)
+                    # Unknown driver -> reflect prev.c2 onto next.c1 (prev.c2
+                    # is already the reflection of the result)
                     next_edge.c1.x = 2 * vx - prev_c2.x
                     next_edge.c1.y = 2 * vy - prev_c2.y
-                    prev_edge.c2.x = 2 * vx - next_edge.c1.x
-                    prev_edge.c2.y = 2 * vy - next_edge.c1.y
 
         # Case B0: prev is Bezier, next is ARC — align Bezier handle to arc tangent
-        elif prev_is_bezier and getattr(next_edge, 'type', None) == EdgeType.ARC:
-            prev_c2 = prev_edge.c2
-            pvx = vx - prev_c2.x
-            pvy = vy - prev_c2.y
-            prev_len = math.hypot(pvx, pvy)
-            if cont == ContinuityType.G1 and prev_len > 1e-8:
-                t = self._arc_tangent_at_vertex(next_edge, at_v1=True)
-                if t is not None:
-                    prev_edge.c2.x = vx - t[0] * prev_len
-                    prev_edge.c2.y = vy - t[1] * prev_len
+        elif prev_is_bezier and next_edge.type == _ARC:
+            if cont == _G1:
+                adjusted = self._align_handle_to_arc(vertex, prev_edge.c2, next_edge, at_v1=True)
 
         # Case B: prev is Bezier, next is LINE — adjust straight-edge endpoint
         elif prev_is_bezier and not next_is_bezier:
             prev_c2 = prev_edge.c2
             pvx = vx - prev_c2.x
             pvy = vy - prev_c2.y
-            prev_len = math.hypot(pvx, pvy)
+            prev_len = hypot(pvx, pvy)
 
             other = next_edge.v2
-            line_constraint = getattr(next_edge, 'constraint_type', ConstraintType.NONE)
-            constraint_val = getattr(next_edge, 'constraint_value', None)
+            line_constraint = next_edge.constraint_type
+            constraint_val = next_edge.constraint_value
 
-            if line_constraint != ConstraintType.NONE:
-                dir_unit, base_len = self._project_direction_to_constraint(
+            if line_constraint != _NO_CONSTRAINT:
+                ux, uy, base_len = _project_direction_to_constraint(
                     vertex,
                     other,
                     (pvx, pvy),
@@ -970,58 +1113,62 @@ class PolygonItem(QGraphicsItem):
                     constraint_val,
                 )
             else:
-                dir_unit, _ = normalize_vector((pvx, pvy))
-                if dir_unit is None:
-                    dir_unit, base_len = normalize_vector((other.x - vx, other.y - vy))
+                # Along the handle, else along the line, else +x
+                ox = other.x - vx
+                oy = other.y - vy
+                base_len = hypot(ox, oy)
+                if prev_len >= 1e-8:
+                    inv = 1.0 / prev_len
+                    ux, uy = pvx * inv, pvy * inv
+                elif base_len >= 1e-8:
+                    inv = 1.0 / base_len
+                    ux, uy = ox * inv, oy * inv
                 else:
-                    base_len = math.hypot(other.x - vx, other.y - vy)
-                if dir_unit is None:
-                    dir_unit = (1.0, 0.0)
+                    ux, uy = 1.0, 0.0
                 if base_len < 1e-8:
                     base_len = prev_len if prev_len > 1e-8 else 1.0
 
             line_len = base_len
-            if cont == ContinuityType.G1:
+            if cont == _G1:
                 if prev_len > 1e-8:
-                    prev_edge.c2.x = vx - dir_unit[0] * prev_len
-                    prev_edge.c2.y = vy - dir_unit[1] * prev_len
-            elif cont == ContinuityType.C1:
-                line_len = base_len if line_constraint == ConstraintType.FIXED_LENGTH else (prev_len if prev_len > 1e-8 else base_len)
-                prev_edge.c2.x = vx - dir_unit[0] * line_len
-                prev_edge.c2.y = vy - dir_unit[1] * line_len
+                    prev_edge.c2.x = vx - ux * prev_len
+                    prev_edge.c2.y = vy - uy * prev_len
+            elif cont == _C1:
+                line_len = base_len if line_constraint == _FIXED_LENGTH else (prev_len if prev_len > 1e-8 else base_len)
+                prev_edge.c2.x = vx - ux * line_len
+                prev_edge.c2.y = vy - uy * line_len
             else:
                 return
 
-            other.x = vx + dir_unit[0] * line_len
-            other.y = vy + dir_unit[1] * line_len
-            moved_vertices.append(other)
+            # A line that already runs along the handle keeps its far vertex,
+            # and there is nothing to propagate from it
+            new_x = vx + ux * line_len
+            new_y = vy + uy * line_len
+            if other.x != new_x or other.y != new_y:
+                other.x = new_x
+                other.y = new_y
+                moved_vertices.append(other)
+            adjusted = True
 
         # Case C0: prev is ARC, next is Bezier — align Bezier handle to arc tangent
-        elif getattr(prev_edge, 'type', None) == EdgeType.ARC and next_is_bezier:
-            next_c1 = next_edge.c1
-            nvx = next_c1.x - vx
-            nvy = next_c1.y - vy
-            next_len = math.hypot(nvx, nvy)
-            if cont == ContinuityType.G1 and next_len > 1e-8:
-                t = self._arc_tangent_at_vertex(prev_edge, at_v1=False)
-                if t is not None:
-                    next_edge.c1.x = vx + t[0] * next_len
-                    next_edge.c1.y = vy + t[1] * next_len
+        elif prev_edge.type == _ARC and next_is_bezier:
+            if cont == _G1:
+                adjusted = self._align_handle_to_arc(vertex, next_edge.c1, prev_edge, at_v1=False)
 
         # Case C: prev is LINE, next is Bezier — adjust previous-line vertex
         elif not prev_is_bezier and next_is_bezier:
             next_c1 = next_edge.c1
             nvx = next_c1.x - vx
             nvy = next_c1.y - vy
-            next_len = math.hypot(nvx, nvy)
+            next_len = hypot(nvx, nvy)
 
             other = prev_edge.v1
-            line_constraint = getattr(prev_edge, 'constraint_type', ConstraintType.NONE)
-            constraint_val = getattr(prev_edge, 'constraint_value', None)
+            line_constraint = prev_edge.constraint_type
+            constraint_val = prev_edge.constraint_value
             desired_dir = (-nvx, -nvy)
 
-            if line_constraint != ConstraintType.NONE:
-                dir_unit, base_len = self._project_direction_to_constraint(
+            if line_constraint != _NO_CONSTRAINT:
+                ux, uy, base_len = _project_direction_to_constraint(
                     vertex,
                     other,
                     desired_dir,
@@ -1029,68 +1176,80 @@ class PolygonItem(QGraphicsItem):
                     constraint_val,
                 )
             else:
-                dir_unit, _ = normalize_vector(desired_dir)
-                if dir_unit is None:
-                    dir_unit, base_len = normalize_vector((other.x - vx, other.y - vy))
+                # Against the handle, else along the line, else -x
+                ox = other.x - vx
+                oy = other.y - vy
+                base_len = hypot(ox, oy)
+                if next_len >= 1e-8:
+                    inv = -1.0 / next_len
+                    ux, uy = nvx * inv, nvy * inv
+                elif base_len >= 1e-8:
+                    inv = 1.0 / base_len
+                    ux, uy = ox * inv, oy * inv
                 else:
-                    base_len = math.hypot(other.x - vx, other.y - vy)
-                if dir_unit is None:
-                    dir_unit = (-1.0, 0.0)
+                    ux, uy = -1.0, 0.0
                 if base_len < 1e-8:
                     base_len = next_len if next_len > 1e-8 else 1.0
 
             line_len = base_len
-            if cont == ContinuityType.G1:
+            if cont == _G1:
                 if next_len > 1e-8:
-                    next_edge.c1.x = vx - dir_unit[0] * next_len
-                    next_edge.c1.y = vy - dir_unit[1] * next_len
-            elif cont == ContinuityType.C1:
-                line_len = base_len if line_constraint == ConstraintType.FIXED_LENGTH else (next_len if next_len > 1e-8 else base_len)
-                next_edge.c1.x = vx - dir_unit[0] * line_len
-                next_edge.c1.y = vy - dir_unit[1] * line_len
+                    next_edge.c1.x = vx - ux * next_len
+                    next_edge.c1.y = vy - uy * next_len
+            elif cont == _C1:
+                line_len = base_len if line_constraint == _FIXED_LENGTH else (next_len if next_len > 1e-8 else base_len)
+                next_edge.c1.x = vx - ux * line_len
+                next_edge.c1.y = vy - uy * line_len
             else:
                 return
 
-            other.x = vx + dir_unit[0] * line_len
-            other.y = vy + dir_unit[1] * line_len
-            moved_vertices.append(other)
-
-        # Update visuals: edges and vertex positions
-        try:
-            self.edge_items[prev_idx].update_edge()
-            self.edge_items[next_idx].update_edge()
-        except Exception:
-            pass
-
-        try:
-            self.updating_from_parent = True
-            for v, v_item in self.vertex_items.items():
-                vertex_parent_coords = self.mapFromScene(QPointF(v.x, v.y))
-                v_item.setPos(vertex_parent_coords)
-        finally:
-            self.updating_from_parent = False
+            # A line that already runs along the handle keeps its far vertex,
+            # and there is nothing to propagate from it
+            new_x = vx + ux * line_len
+            new_y = vy + uy * line_len
+            if other.x != new_x or other.y != new_y:
+                other.x = new_x
+                other.y = new_y
+                moved_vertices.append(other)
+            adjusted = True
+
+        # The moved control point's own edge is redrawn by the caller. The
+        # edges at this junction are redrawn in one batch with those around
+        # the vertices that moved (on_vertex_moved flushes the dirty set)
+        if adjusted:
+            self._dirty_edges.add(prev_idx)
+            self._dirty_edges.add(next_idx)
+        else:
+            # Nothing was adjusted, but an arc here still takes its tangent
+            # from the moved handle
+            prev_is_arc = prev_edge.type == _ARC
+            next_is_arc = next_edge.type == _ARC
+            if not (prev_is_arc or next_is_arc):
+                return
+            if prev_is_arc:
+                self._dirty_edges.add(prev_idx)
+            if next_is_arc:
+                self._dirty_edges.add(next_idx)
 
         for moved in moved_vertices:
-            self.on_vertex_moved(moved, QPointF(moved.x, moved.y))
+            self.on_vertex_moved(moved)
+        self._flush_dirty_edges()
 
-        try:
-            self.update()
-        except Exception:
-            pass
+        self.update()
 
     # Method called by LineEdgeItem when user wants to create new vertex
     def add_vertex_on_edge(self, edge: Edge):
         v1 = edge.v1
         v2 = edge.v2
+        vertices = self.polygon.vertices
+        edges = self.polygon.edges
         new_vertex = Vertex((v1.x + v2.x) / 2, (v1.y + v2.y) / 2)
-        old_edge_index = self.polygon.edges.index(edge)
+        old_edge_index = self.edge_index(edge)
+        self._invalidate_geometry()
 
         # Insert new vertex in polygon.vertices right after v1
-        try:
-            v1_idx = self.polygon.vertices.index(v1)
-        except ValueError:
-            v1_idx = len(self.polygon.vertices) - 1
-        self.polygon.vertices.insert(v1_idx + 1, new_vertex)
+        v1_idx = self._vertex_index.get(v1, len(vertices) - 1)
+        vertices.insert(v1_idx + 1, new_vertex)
 
         # Replace edges: edge -> [edge(v1,new_v), edge(new_v,v2)]
         new_edge1 = Edge(v1, new_vertex)
@@ -1100,8 +1259,7 @@ class PolygonItem(QGraphicsItem):
         new_edge1.constraint_value = None
         new_edge2.constraint_type = ConstraintType.NONE
         new_edge2.constraint_value = None
-        self.polygon.edges[old_edge_index] = new_edge1
-        self.polygon.edges.insert(old_edge_index + 1, new_edge2)
+        edges[old_edge_index:old_edge_index + 1] = (new_edge1, new_edge2)
 
         # Sync the model's edge dictionary now that edges changed, then
         # rebuild view based on the new model
@@ -1111,34 +1269,37 @@ class PolygonItem(QGraphicsItem):
 
     # Method called by VertexItem when user wants to delete it
     def delete_vertex(self, vertex: Vertex):
-        n = len(self.polygon.vertices)
+        vertices = self.polygon.vertices
+        edges = self.polygon.edges
+        n = len(vertices)
 
         # We require at least 3 to keep the polygon structure
         if n > 3:
-            del_vertex_index = self.polygon.vertices.index(vertex)
+            del_vertex_index = self._vertex_index[vertex]
             prev_vertex_index = (del_vertex_index - 1) % n
             next_vertex_index = (del_vertex_index + 1) % n
 
-            prev_vertex = self.polygon.vertices[prev_vertex_index]
-            next_vertex = self.polygon.vertices[next_vertex_index]
+            prev_vertex = vertices[prev_vertex_index]
+            next_vertex = vertices[next_vertex_index]
+            self._invalidate_geometry()
 
             # Remove the vertex from vertices list
-            del self.polygon.vertices[del_vertex_index]
-
-            # Find the two edges that reference this vertex and replace them by
-            # a single edge connecting prev_v -> next_v
-            edge_indices = [i for i, e in enumerate(self.polygon.edges) if e.v1 is vertex or e.v2 is vertex]
-
-            # We sort them for easier referencing
-            edge_indices.sort()
-            # Replace the lower index with the new connecting edge
-            replace_index = edge_indices[0]
-            self.polygon.edges[replace_index] = Edge(prev_vertex, next_vertex)
-
-            # Remove the other edge(s) that were connected with the deleted 
-            # vertex. Iterate from highest to lowest to keep indices valid
-            for del_edge_index in reversed(edge_indices[1:]):
-                del self.polygon.edges[del_edge_index]
+            del vertices[del_vertex_index]
+
+            # The two edges that reference this vertex are replaced by a
+            # single edge connecting prev_v -> next_v
+            _, prev_idx, _, next_idx = self.adjacent_edges_of_vertex(vertex)
+
+            # The new edge takes the place of the lower index
+            lo, hi = sorted((prev_idx, next_idx))
+            new_edge = Edge(prev_vertex, next_vertex)
+            if hi - lo == 1:
+                # Neighbouring entries: swap both for the new edge in one go
+                edges[lo:hi + 1] = (new_edge,)
+            else:
+                # Deleted vertex closes the polygon (edges at 0 and n - 1)
+                edges[lo] = new_edge
+                del edges[hi]
 
             # Sync edges dict and rebuild view based on the new model
             self._sync_edges_dict()
@@ -1157,129 +1318,132 @@ class PolygonItem(QGraphicsItem):
                 pass
 
     def apply_constraint_to_edge(self, edge: Edge, constraint_type: ConstraintType, value=None) -> bool:
-        idx = self.polygon.edges.index(edge)
+        idx = self.edge_index(edge)
 
         # If clearing constraint
-        if constraint_type == ConstraintType.NONE:
-            edge.constraint_type = ConstraintType.NONE
+        if constraint_type == _NO_CONSTRAINT:
+            edge.constraint_type = _NO_CONSTRAINT
             edge.constraint_value = None
-            self._rebuild_childitems()
+            self._propagation_chains.clear()
+            # Only the constraint icon of this edge has to be repainted
+            self.edge_items[idx].update()
             return True
 
         # Check neighbor constraints for disallowed combinations
-        n = len(self.polygon.edges)
-        prev_edge = self.polygon.edges[(idx - 1) % n]
-        next_edge = self.polygon.edges[(idx + 1) % n]
-        if constraint_type == ConstraintType.VERTICAL:
-            if getattr(prev_edge, 'constraint_type', ConstraintType.NONE) == ConstraintType.VERTICAL or getattr(next_edge, 'constraint_type', ConstraintType.NONE) == ConstraintType.VERTICAL:
+        edges = self.polygon.edges
+        n = len(edges)
+        prev_edge = edges[(idx - 1) % n]
+        next_edge = edges[(idx + 1) % n]
+        if constraint_type == _VERTICAL:
+            if prev_edge.constraint_type == _VERTICAL or next_edge.constraint_type == _VERTICAL:
                 return False
 
         # Apply constraint to model
+        self._invalidate_geometry()
         edge.constraint_type = constraint_type
         edge.constraint_value = value
+        self._propagation_chains.clear()
 
         # Enforce the constraint immediately by adjusting one endpoint (v2)
         other = edge.v1
         moving = edge.v2
-        if constraint_type == ConstraintType.VERTICAL:
-            moving.x = other.x
-        elif constraint_type == ConstraintType.DIAGONAL_45:
-            # Set direction to nearest 45° and preserve current Euclidean length
-            dx = moving.x - other.x
-            dy = moving.y - other.y
-            dist = math.hypot(dx, dy)
-            if dist < 1e-8:
-                sx = 1 if dx >= 0 else -1
-                sy = 1 if dy >= 0 else -1
-                inv_sqrt2 = 1.0 / math.sqrt(2.0)
-                ux = sx * inv_sqrt2
-                uy = sy * inv_sqrt2
-                step = 1.0
-                moving.x = other.x + ux * step
-                moving.y = other.y + uy * step
-            else:
-                sx = 1 if dx >= 0 else -1
-                sy = 1 if dy >= 0 else -1
-                inv_sqrt2 = 1.0 / math.sqrt(2.0)
-                ux = sx * inv_sqrt2
-                uy = sy * inv_sqrt2
-                moving.x = other.x + ux * dist
-                moving.y = other.y + uy * dist
-        elif constraint_type == ConstraintType.FIXED_LENGTH:
-            L = value
-            if L is None:
-                # nothing to enforce
-                pass
-            else:
-                dx = moving.x - other.x
-                dy = moving.y - other.y
-                dist = (dx*dx + dy*dy) ** 0.5
-                if dist == 0:
-                    moving.x = other.x + L
-                    moving.y = other.y
-                else:
-                    scale = L / dist
-                    moving.x = other.x + dx * scale
-                    moving.y = other.y + dy * scale
+        # A fixed length without a value has nothing to enforce
+        if constraint_type != _FIXED_LENGTH or value is not None:
+            _CONSTRAINT_FNS[constraint_type](other, moving, edge)
 
-        # Rebuild view to show icon and updated positions
-        self._rebuild_childitems()
+        # Refresh only the items touched by the moved endpoint instead of
+        # repainting the whole polygon
+        self._refresh_items_around_vertex(moving)
         return True
 
+    # Repositions the VertexItem of the given vertex and redraws only the edge
+    # items whose geometry depends on it
+    def _refresh_items_around_vertex(self, vertex: Vertex):
+        self.updating_from_parent = True
+        try:
+            ox, oy = self._scene_origin()
+            self.vertex_items[vertex].setPos(vertex.x - ox, vertex.y - oy)
+        finally:
+            self.updating_from_parent = False
+
+        self._mark_edges_around_vertex_dirty(vertex)
+        self._flush_dirty_edges()
+
+        # The selection outline follows the polygon shape
+        if self.isSelected():
+            self.update()
+
+    # Marks the edges incident to a moved vertex for the next
+    # _flush_dirty_edges() call
+    def _mark_edges_around_vertex_dirty(self, vertex: Vertex):
+        _, prev_idx, _, next_idx = self.adjacent_edges_of_vertex(vertex)
+        edges = self.polygon.edges
+        n_edges = len(edges)
+        for idx in (prev_idx, next_idx):
+            if idx is None:
+                continue
+            self._dirty_edges.add(idx)
+            # G1 arcs take their tangent from the neighbouring edge, so arcs
+            # next to an incident edge may have to be bent differently too
+            for n_idx in ((idx - 1) % n_edges, (idx + 1) % n_edges):
+                if edges[n_idx].type == _ARC:
+                    self._dirty_edges.add(n_idx)
+
+    def _flush_dirty_edges(self):
+        for idx in self._dirty_edges:
+            e_item = self.edge_items[idx]
+            e_item.update_edge()
+            e_item.update()
+        self._dirty_edges.clear()
+
     # Method called by MainWindow when line drawing mode is changed
     def redraw_with_new_mode(self, mode: LineDrawingMode):
         # Update line drawing mode
         self._line_drawing_mode = mode
-
-        # Remove old edge items
-        for e_item in self.edge_items:
-            e_item.setParentItem(None)
-            scene = self.scene()
+        # Bresenham items have slightly different bounding rects
+        self._invalidate_geometry()
+
+        # Only line items depend on the drawing mode: Bezier and arc items
+        # (with their control handles) are kept, line items are replaced.
+        # Removing a child from the scene also detaches it from its parent,
+        # so each old item is unlinked in a single call
+        scene = self.scene()
+        factory = self.EdgeItemFactory
+        edge_items = self.edge_items
+        for i, e_item in enumerate(edge_items):
+            if e_item.edge.type != _LINE:
+                continue
             if scene:
                 scene.removeItem(e_item)
-        self.edge_items.clear()
-
-        # Create new edge items according to new drawing mode
-        for e in self.polygon.edges:
-            e_item = self.EdgeItemFactory(e, parent=self)
-            self.edge_items.append(e_item)
-            # Redrawing
+            else:
+                e_item.setParentItem(None)
+            e_item = factory(e_item.edge, parent=self)
             e_item.update_edge()
+            edge_items[i] = e_item
 
+        self._last_rebuild_sig = self._childitems_signature()
         self.update()
 
     def _enforce_all_constraints_and_continuity(self):
         # Sync map for robustness
         self._sync_edges_dict()
 
-        # 1) Enforce constraints edge-by-edge (no propagation needed here)
-        for e in list(self.polygon.edges):
-            if getattr(e, 'constraint_type', ConstraintType.NONE) != ConstraintType.NONE:
+        # 1) Enforce constraints edge-by-edge (no propagation needed here).
+        # Enforcers only move vertices, so the edge list is walked in place
+        for e in self.polygon.edges:
+            if e.constraint_type != _NO_CONSTRAINT:
                 try:
-                    self._enforce_edge_constraint(e.v1, e.v2)
+                    self._enforce_edge_constraint(e, e.v1, e.v2)
                 except Exception:
                     continue
 
-        # 2) Enforce continuity at vertices that request it
-        for v in list(self.polygon.vertices):
-            cont = getattr(v, 'continuity', None)
-            if cont is not None and cont != ContinuityType.G0:
-                try:
-                    self.enforce_vertex_continuity_from_vertex(v)
-                except Exception:
-                    continue
+        # 2) Enforce continuity at vertices that request it (visuals are
+        # refreshed for all edges below)
+        for v in self._non_g0_vertices_in_order():
+            try:
+                self.enforce_vertex_continuity_from_vertex(v, defer_update=True)
+            except Exception:
+                continue
 
         # 3) Refresh visuals: positions and edges
-        self.updating_from_parent = True
-        try:
-            for v, v_item in self.vertex_items.items():
-                vertex_parent_coords = self.mapFromScene(QPointF(v.x, v.y))
-                v_item.setPos(vertex_parent_coords)
-            for e_item in self.edge_items:
-                e_item.update_edge()
-        finally:
-            self.updating_from_parent = False
-        try:
-            self.update()
-        except Exception:
-            pass
\ No newline at end of file
+        self._refresh_childitems()
\ No newline at end of file
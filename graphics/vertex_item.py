@@ -13,14 +13,19 @@ from PySide6.QtGui import (
 
 # Represent vertex of a polygon as a movable ellipse item
 class VertexItem(QGraphicsEllipseItem):
-    def __init__(self, vertex : Vertex, parent=None):
+    def __init__(self, vertex : Vertex, parent=None, x: float = 0.0, y: float = 0.0):
         # We call the constructor of the base class to create an ellipse item
         super().__init__(-VERTEX_DIAMETER/2, -VERTEX_DIAMETER/2, 
                          VERTEX_DIAMETER, VERTEX_DIAMETER, parent)
+        # Initial position (in parent coordinates) is set before position
+        # changes are reported, so it never reaches itemChange
+        self.setPos(x, y)
         self.vertex = vertex
         self.setBrush(QBrush(QColor("black")))
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable, True)
-        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemSendsScenePositionChanges, True)
+        # Only the item's own position changes are needed; scene position
+        # changes would also be reported whenever the polygon is dragged
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges, True)
         # Setting Z value to be on top of edges
         self.setZValue(2.0)
 
@@ -43,43 +48,21 @@ class VertexItem(QGraphicsEllipseItem):
         del_action = menu.addAction("Delete vertex")
         menu.addSeparator()
 
-        # Determine allowed continuity options based on adjacent edge types
+        # Continuity options allowed by the adjacent edge types: G0 whenever a
+        # Bezier curve or an arc is involved, G1 as well, and C1 only without
+        # arcs. Each option gets its action straight away, mapped to its type
         parent = self.parentItem()
-        allowed = {"G0": False, "G1": False, "C1": False}
+        allowed = ()
         prev_edge, _, next_edge, _ = parent.adjacent_edges_of_vertex(self.vertex)
         if prev_edge is not None and next_edge is not None:
-            prev_type = prev_edge.type
-            next_type = next_edge.type
-            has_bezier = (prev_type == EdgeType.BEZIER) or (next_type == EdgeType.BEZIER)
-            has_arc = (prev_type == EdgeType.ARC) or (next_type == EdgeType.ARC)
-            has_line_only = (prev_type == EdgeType.LINE) and (next_type == EdgeType.LINE)
-            if not has_line_only:
-                # G0 always allowed when at least one adjacent edge is Bezier or Arc
-                allowed["G0"] = True
-                if has_arc:
-                    # Any arc involved: allow G1 only (no C1 for arcs)
-                    allowed["G1"] = True
-                elif has_bezier:
-                    # Bezier-bezier or bezier-line: allow G1 and C1
-                    allowed["G1"] = True
-                    allowed["C1"] = True
-
-        set_g0_action = set_g1_action = set_c1_action = None
-        if allowed["G0"]:
-            set_g0_action = menu.addAction("Set continuity: G0")
-        if allowed["G1"]:
-            set_g1_action = menu.addAction("Set continuity: G1")
-        if allowed["C1"]:
-            set_c1_action = menu.addAction("Set continuity: C1")
-
-        # Map created actions to their continuity types for robust handling
-        continuity_map = {}
-        if set_g0_action is not None:
-            continuity_map[set_g0_action] = ContinuityType.G0
-        if set_g1_action is not None:
-            continuity_map[set_g1_action] = ContinuityType.G1
-        if set_c1_action is not None:
-            continuity_map[set_c1_action] = ContinuityType.C1
+            types = (prev_edge.type, next_edge.type)
+            if EdgeType.ARC in types:
+                allowed = (ContinuityType.G0, ContinuityType.G1)
+            elif EdgeType.BEZIER in types:
+                allowed = (ContinuityType.G0, ContinuityType.G1, ContinuityType.C1)
+        continuity_map = {
+            menu.addAction(f"Set continuity: {cont.name}"): cont for cont in allowed
+        }
 
         # Converting screenPos from QPointF to QPoint so we can pass it to
         # menu.exec()
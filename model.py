@@ -22,12 +22,18 @@ class LineDrawingMode(Enum):
     BRESENHAM = 2
 
 class Vertex:
+    # Model objects are read on every drag event; slots keep attribute access
+    # cheap and catch misspelt attributes
+    __slots__ = ('x', 'y', 'continuity')
+
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
         self.continuity: ContinuityType = ContinuityType.G0
 
 class Edge:
+    __slots__ = ('v1', 'v2', 'type', 'constraint_type', 'constraint_value')
+
     def __init__(self, v1: Vertex, v2: Vertex, type: EdgeType = EdgeType.LINE):
         self.v1 = v1
         self.v2 = v2
@@ -63,15 +69,18 @@ class Polygon:
         self.vertices = [vertex_0, vertex_1, vertex_2, vertex_3, vertex_4]
         self.edges = [edge_01, edge_12, edge_23, edge_34, edge_40]
         for edge in self.edges:
-            self.edges_dict[(edge.v1, edge.v2)] = edge
-            self.edges_dict[(edge.v2, edge.v1)] = edge
+            self.edges_dict[frozenset((edge.v1, edge.v2))] = edge
             
 class Bezier(Edge):
+    __slots__ = ('c1', 'c2')
+
     def __init__(self, v1: Vertex, v2: Vertex, c1: Vertex, c2: Vertex):
         super().__init__(v1, v2, EdgeType.BEZIER)
         self.c1 = c1 # Control point associated with v1
         self.c2 = c2 # Control point associated with v2
 
 class Arc(Edge):
+    __slots__ = ()
+
     def __init__(self, v1: Vertex, v2: Vertex):
         super().__init__(v1, v2, EdgeType.ARC)
\ No newline at end of file